@@ -1,5 +1,15 @@
 """Showcov CLI tooling."""
 
-from ._meta import __version__, logger
+from . import _meta
+from ._meta import logger
 
-__all__ = ["__version__", "logger"]
+
+def __getattr__(name: str) -> str:
+    # `__version__` is resolved lazily by `_meta`; forward it without forcing the lookup at import.
+    if name == "__version__":
+        return _meta.__version__
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+__all__ = ["__version__", "logger"]  # ruff: ignore[undefined-export]
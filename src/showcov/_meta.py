@@ -1,10 +1,20 @@
 from __future__ import annotations
 
 import logging
-from importlib.metadata import version
-
-__version__ = version("showcov")
 
 logger = logging.getLogger("showcov")
 
-__all__ = ["__version__", "logger"]
+
+def __getattr__(name: str) -> str:
+    # Looking up distribution metadata imports importlib.metadata and scans sys.path,
+    # so only pay for it when the version is actually asked for.
+    if name == "__version__":
+        from importlib.metadata import version  # ruff: ignore[import-outside-top-level]
+
+        value = globals()["__version__"] = version("showcov")
+        return value
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+__all__ = ["__version__", "logger"]  # ruff: ignore[undefined-export]
@@ -3,17 +3,24 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
+from xml.etree.ElementTree import XMLParser as _StdlibXMLParser  # ruff: ignore[suspicious-xml-etree-import]
 
 from defusedxml import ElementTree
 
 from showcov.errors import InvalidCoverageXMLError
 from showcov.model.report import BranchCondition
 
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:  # pragma: no cover - optional accelerator
+    _lxml_etree = None
+
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator, Mapping
     from pathlib import Path
+    from xml.etree.ElementTree import Element
 
-    from showcov.adapters.coverage.types import ElementLike
+    from showcov.adapters.coverage.types import AttributeSource, ElementLike
 
 
 @dataclass(frozen=True, slots=True)
@@ -65,10 +72,17 @@ def _parse_missing_branches(text: str | None) -> tuple[int, ...]:
 
 
 def parse_conditions(line_elem: ElementLike) -> tuple[BranchCondition, ...]:
+    return _build_conditions(line_elem, line_elem.findall(".//condition"))
+
+
+def _build_conditions(
+    line_elem: AttributeSource,
+    cond_elems: Iterable[AttributeSource],
+) -> tuple[BranchCondition, ...]:
     out: list[BranchCondition] = []
     seen_numbers: set[int] = set()
 
-    for cond in line_elem.findall(".//condition"):
+    for cond in cond_elems:
         try:
             num = int(cond.get("number", "-1") or "-1")
         except ValueError:
@@ -100,38 +114,200 @@ def parse_conditions(line_elem: ElementLike) -> tuple[BranchCondition, ...]:
     return tuple(out)
 
 
+def _line_record(
+    filename: str,
+    line_elem: AttributeSource,
+    cond_elems: Iterable[AttributeSource],
+) -> LineRecord | None:
+    n_raw = line_elem.get("number")
+    hits_raw = line_elem.get("hits")
+    if not n_raw or hits_raw is None:
+        return None
+    try:
+        n = int(n_raw)
+        hits = int(hits_raw)
+    except ValueError:
+        return None
+
+    cc = parse_condition_coverage(line_elem.get("condition-coverage", "") or "")
+    missing = _parse_missing_branches(line_elem.get("missing-branches"))
+    conds = _build_conditions(line_elem, cond_elems)
+    return LineRecord(
+        file=filename,
+        line=n,
+        hits=hits,
+        branch_counts=cc,
+        missing_branches=missing,
+        conditions=conds,
+    )
+
+
 def iter_line_records(root: ElementLike) -> Iterable[LineRecord]:
     for cls in root.findall(".//class"):
         filename = cls.get("filename")
         if not filename:
             continue
         for line_elem in cls.findall("./lines/line"):
-            n_raw = line_elem.get("number")
-            hits_raw = line_elem.get("hits")
-            if not n_raw or hits_raw is None:
-                continue
-            try:
-                n = int(n_raw)
-                hits = int(hits_raw)
-            except ValueError:
-                continue
+            rec = _line_record(filename, line_elem, line_elem.findall(".//condition"))
+            if rec is not None:
+                yield rec
+
+
+class _CoberturaTarget:
+    """Parser target that builds LineRecords from start/end events, never creating elements.
+
+    It has no ``data`` method, so parsers skip text callbacks entirely.
+
+    Selects the same lines as ``iter_line_records``: ``<line>`` elements directly under
+    ``<class>/<lines>``, with every nested ``<condition>``.
+    """
+
+    __slots__ = ("_conds", "_filename", "_line", "_path", "_stack", "records")
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._stack: list[str] = []
+        self._filename: str | None = None
+        self._line: dict[str, str] | None = None
+        self._conds: list[dict[str, str]] = []
+        self.records: list[LineRecord] = []
+
+    def start(self, tag: str, attrib: Mapping[str, str]) -> None:
+        stack = self._stack
+        if not stack and tag.rsplit("}", 1)[-1].lower() != "coverage":
+            msg = f"unexpected root tag {tag!r} in {self._path}"
+            raise InvalidCoverageXMLError(msg)
+        if tag == "class":
+            self._filename = attrib.get("filename")
+        elif tag == "line" and self._filename and stack[-2:] == ["class", "lines"]:
+            self._line = dict(attrib)
+            self._conds = []
+        elif tag == "condition" and self._line is not None:
+            self._conds.append(dict(attrib))
+        stack.append(tag)
+
+    def end(self, tag: str) -> None:
+        self._stack.pop()
+        if tag == "line" and self._line is not None and self._stack[-2:] == ["class", "lines"]:
+            if self._filename:
+                rec = _line_record(self._filename, self._line, self._conds)
+                if rec is not None:
+                    self.records.append(rec)
+            self._line = None
+        elif tag == "class":
+            self._filename = None
+
+    def close(self) -> list[LineRecord]:
+        return self.records
+
+
+class _DoctypeDeclaredError(Exception):
+    """Raised by ``_LxmlCoberturaTarget`` to hand DTD-bearing files back to defusedxml."""
+
+
+class _LxmlCoberturaTarget(_CoberturaTarget):
+    __slots__ = ()
+
+    @staticmethod
+    def doctype(*_args: str | None) -> None:
+        # lxml cannot forbid entity declarations the way defusedxml does, so any file that
+        # declares a DTD is parsed by the defusedxml stream instead. The callback fires
+        # before the internal subset is processed, so no declaration reaches lxml.
+        raise _DoctypeDeclaredError
+
+
+def _lxml_line_records(path: Path) -> list[LineRecord]:
+    target = _LxmlCoberturaTarget(path)
+    # Entity resolution and network access stay off, mirroring the defusedxml defaults.
+    parser = _lxml_etree.XMLParser(
+        target=target,
+        resolve_entities=False,
+        no_network=True,
+        huge_tree=False,
+    )
+    try:
+        _lxml_etree.parse(str(path), parser)
+    except _DoctypeDeclaredError:
+        return list(_iterparse_line_records(path))
+    except _lxml_etree.XMLSyntaxError as exc:
+        msg = f"{exc} in {path}"
+        raise InvalidCoverageXMLError(msg) from exc
+    return target.records
+
+
+_TRUSTED_READ_CHUNK = 1 << 16
+
+
+def _trusted_line_records(path: Path) -> list[LineRecord]:
+    # Caller vouches for the file, so skip defusedxml's per-declaration guards and
+    # feed the stdlib expat parser directly into the element-free target.
+    parser = _StdlibXMLParser(target=_CoberturaTarget(path))  # ruff: ignore[suspicious-xml-element-tree-usage]
+    with path.open("rb") as fh:
+        while chunk := fh.read(_TRUSTED_READ_CHUNK):
+            parser.feed(chunk)
+    return parser.close()
+
+
+def iter_path_line_records(path: Path, *, trusted: bool = False) -> Iterator[LineRecord]:
+    """Stream line records from a coverage XML file without materializing the full tree.
+
+    Equivalent to ``iter_line_records(read_root(path))``, but each ``<line>`` is
+    handled as soon as it is closed and finished ``<class>`` subtrees are cleared and
+    detached from their parent, so peak memory no longer scales with the size of the document.
+
+    When the optional ``lxml`` package is installed, its compiled parser drives a
+    ``_CoberturaTarget`` instead, so no element objects are created at all. Files that
+    declare a DTD still go through ``defusedxml`` so entity declarations are rejected.
+
+    ``trusted=True`` is for files the user generated themselves: it always feeds the
+    stdlib expat parser straight into the target, with or without ``lxml``, skipping
+    the ``defusedxml`` guards.
+    """
+    if trusted:
+        yield from _trusted_line_records(path)
+        return
+    if _lxml_etree is not None:
+        yield from _lxml_line_records(path)
+        return
+    yield from _iterparse_line_records(path)
+
+
+def _iterparse_line_records(path: Path) -> Iterator[LineRecord]:
+    stack: list[str] = []
+    # Open elements, parallel to `stack`, so finished classes can be detached from their parent.
+    open_elems: list[Element] = []
+    filename: str | None = None
+    for event, elem in ElementTree.iterparse(path, events=("start", "end")):
+        tag = elem.tag or ""
+        if event == "start":
+            if not stack and tag.split("}")[-1].lower() != "coverage":
+                msg = f"unexpected root tag {tag!r} in {path}"
+                raise InvalidCoverageXMLError(msg)
+            stack.append(tag)
+            open_elems.append(elem)
+            if tag == "class":
+                filename = elem.get("filename")
+            continue
 
-            cc = parse_condition_coverage(line_elem.get("condition-coverage", "") or "")
-            missing = _parse_missing_branches(line_elem.get("missing-branches"))
-            conds = parse_conditions(line_elem)
-            yield LineRecord(
-                file=filename,
-                line=n,
-                hits=hits,
-                branch_counts=cc,
-                missing_branches=missing,
-                conditions=conds,
-            )
+        stack.pop()
+        open_elems.pop()
+        if tag == "line" and filename and stack[-2:] == ["class", "lines"]:
+            rec = _line_record(filename, elem, elem.findall(".//condition"))
+            if rec is not None:
+                yield rec
+        elif tag == "class":
+            filename = None
+            elem.clear()
+            # Clearing alone leaves an empty shell per class under <classes>; detaching it
+            # keeps peak memory at one class. It is always the parent's first child here.
+            if open_elems:
+                open_elems[-1].remove(elem)
 
 
 __all__ = [
     "LineRecord",
     "iter_line_records",
+    "iter_path_line_records",
     "parse_condition_coverage",
     "parse_conditions",
     "read_root",
@@ -25,8 +25,7 @@ def _find_project_root(start: Path) -> Path:
 def _pyproject_coverage_xml_output(project_root: Path) -> Path | None:
     """Return tool.coverage.xml.output if present."""
     pp = project_root / "pyproject.toml"
-    if not pp.exists():
-        return None
+    # A missing file surfaces as OSError below; no separate exists() stat needed.
     try:
         data = tomllib.loads(pp.read_text(encoding="utf-8"))
     except OSError:
@@ -51,15 +50,13 @@ def discover_coverage_paths(*, cwd: Path) -> tuple[Path, ...]:
     if from_pyproject and from_pyproject.exists():
         return (from_pyproject,)
 
-    candidates = [
-        (cwd / ".coverage.xml").resolve(),
-        (cwd / "coverage.xml").resolve(),
-        (root / ".coverage.xml").resolve(),
-        (root / "coverage.xml").resolve(),
-    ]
-    for c in candidates:
-        if c.exists():
-            return (c,)
+    # Probe the unresolved candidates and canonicalize only the hit; when cwd is the
+    # project root, each location is checked once.
+    for directory in dict.fromkeys((cwd, root)):
+        for name in (".coverage.xml", "coverage.xml"):
+            c = directory / name
+            if c.exists():
+                return (c.resolve(),)
 
     msg = (
         "no coverage XML provided and none discovered.\n"
@@ -73,11 +70,20 @@ def resolve_coverage_paths(cov_paths: Sequence[Path] | None, *, cwd: Path) -> tu
     """Resolve explicit XMLs or discover if none are provided."""
     paths = tuple(cov_paths or ())
     if paths:
-        missing = [p for p in paths if not p.exists()]
+        # A strict resolve checks existence and canonicalizes in one walk per path.
+        resolved: list[Path] = []
+        missing: list[Path] = []
+        for p in paths:
+            try:
+                resolved.append(p.resolve(strict=True))
+            except (OSError, RuntimeError):
+                missing.append(p)
         if missing:
             msg = f"coverage XML not found: {', '.join(str(p) for p in missing)}"
             raise CoverageXMLNotFoundError(msg)
-        return tuple(p.resolve() for p in paths)
+        # The same report passed twice (e.g. via different relative paths) would be parsed
+        # twice for an identical merge result; keep the first occurrence only.
+        return tuple(dict.fromkeys(resolved))
 
     return discover_coverage_paths(cwd=cwd)
 
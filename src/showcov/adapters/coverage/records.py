@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import TYPE_CHECKING
 
-from showcov.adapters.coverage.cobertura import iter_line_records, read_root
+from showcov.adapters.coverage.cobertura import iter_path_line_records
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -11,12 +14,21 @@ if TYPE_CHECKING:
     from showcov.model.records import Record
 
 
-def collect_cobertura_records(paths: Sequence[Path]) -> list[Record]:
-    out: list[Record] = []
-    for p in paths:
-        root = read_root(p)
-        out.extend(
-            (rec.file, rec.line, rec.hits, rec.branch_counts, rec.missing_branches, rec.conditions)
-            for rec in iter_line_records(root)
-        )
-    return out
+def _file_records(path: Path, *, trusted: bool = False) -> list[Record]:
+    return [
+        (rec.file, rec.line, rec.hits, rec.branch_counts, rec.missing_branches, rec.conditions)
+        for rec in iter_path_line_records(path, trusted=trusted)
+    ]
+
+
+def collect_cobertura_records(paths: Sequence[Path], *, trusted: bool = False) -> list[Record]:
+    read = partial(_file_records, trusted=trusted)
+    # A pool only pays off with more than one file and more than one core to run it on.
+    workers = min(len(paths), os.cpu_count() or 1)
+    if workers <= 1:
+        return [rec for p in paths for rec in read(p)]
+
+    # Files are independent, so parse them concurrently. `map` yields in input order,
+    # which keeps merged records (and therefore merge tie-breaks) deterministic.
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return [rec for recs in pool.map(read, paths) for rec in recs]
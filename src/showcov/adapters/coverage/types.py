@@ -3,6 +3,12 @@ from __future__ import annotations
 from typing import Protocol
 
 
+class AttributeSource(Protocol):
+    """Anything exposing XML attributes through ``get`` (an element or a parser attrib dict)."""
+
+    def get(self, key: str, default: str | None = None) -> str | None: ...
+
+
 class ElementLike(Protocol):
     """Simplified Element protocol that matches the subset of behavior we consume."""
 
@@ -13,4 +19,4 @@ class ElementLike(Protocol):
     def get(self, key: str, default: str | None = None) -> str | None: ...
 
 
-__all__ = ["ElementLike"]
+__all__ = ["AttributeSource", "ElementLike"]
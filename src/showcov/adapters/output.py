@@ -1,10 +1,68 @@
+from __future__ import annotations
+
+import os
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Large reports are encoded and written in slices of this many characters, so writing
+# never holds a second full-size UTF-8 copy of the text in memory.
+_FILE_WRITE_CHUNK = 1 << 16
+
+
+def _slices(text: str) -> Iterable[str]:
+    for start in range(0, len(text), _FILE_WRITE_CHUNK):
+        yield text[start : start + _FILE_WRITE_CHUNK]
 
 
-def write_output(text: str, destination: Path | None) -> None:
-    """Write output to stdout or a file (PATH or '-' for stdout)."""
+def _write_stdout(chunks: Iterable[str]) -> None:
+    # Encode once and hand the bytes to the binary buffer instead of going through the
+    # text layer's incremental encoding. Fall back to the text stream for streams without a
+    # buffer (e.g. some capture wrappers) and where the text layer translates newlines.
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None or os.linesep != "\n":
+        for chunk in chunks:
+            stream.write(chunk)
+        stream.write("\n")
+        return
+    encoding = stream.encoding or "utf-8"
+    errors = stream.errors or "strict"
+    # Encode each chunk and write the newline separately; joining first would copy the
+    # whole report once more before encoding.
+    stream.flush()
+    for chunk in chunks:
+        buffer.write(chunk.encode(encoding, errors))
+    buffer.write("\n".encode(encoding, errors))
+    buffer.flush()
+
+
+def write_output(text: str | Iterable[str], destination: Path | None) -> None:
+    """Write output to stdout or a file (PATH or '-' for stdout).
+
+    ``text`` may be the whole report or an iterable of chunks (e.g. from
+    ``render_chunks``). Chunks are streamed to stdout as they are produced; for a
+    file they are collected first, so a renderer failure never leaves it half-written.
+    """
     if destination is None or destination == Path("-"):
-        print(text)
+        _write_stdout((text,) if isinstance(text, str) else text)
+        return
+    if not isinstance(text, str):
+        text = "".join(text)
+    # Only create the parent when it is missing; the common case writes into an existing directory.
+    parent = destination.parent
+    if parent != Path() and not parent.is_dir():
+        parent.mkdir(parents=True, exist_ok=True)
+    if os.linesep != "\n":
+        # Keep the platform newline translation of text mode.
+        with destination.open("w", encoding="utf-8") as fh:
+            for piece in _slices(text):
+                fh.write(piece)
         return
-    destination.parent.mkdir(parents=True, exist_ok=True)
-    destination.write_text(text, encoding="utf-8")
+    # Encode each slice ourselves and write bytes, bypassing the text layer's encoder.
+    with destination.open("wb") as fb:
+        for piece in _slices(text):
+            fb.write(piece.encode("utf-8"))
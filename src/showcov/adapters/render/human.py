@@ -3,12 +3,11 @@ from __future__ import annotations
 import operator
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from pathlib import PurePosixPath
 from typing import TYPE_CHECKING
 
 from rich.table import Table
 
-from showcov.adapters.render.table import format_table, render_table
+from showcov.adapters.render.table import format_table, new_table, render_table
 from showcov.model.metrics import pct  # <-- you also hit NameError earlier
 from showcov.model.report import (
     SummaryCounts,
@@ -16,7 +15,7 @@ from showcov.model.report import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Sequence
+    from collections.abc import Callable, Iterable, Iterator, Sequence
 
     from showcov.adapters.render.render import RenderOptions
     from showcov.model.report import (
@@ -33,6 +32,14 @@ _NO_BRANCHES = "No uncovered branches."
 _NO_SUMMARY = "No summary data."
 
 
+def _posix_parts(path: str) -> list[str]:
+    """Return ``PurePosixPath(path).parts`` for a normalized report label, without a path object."""
+    parts = path.split("/")
+    if not parts[0] and len(parts) > 1:
+        parts[0] = "/"
+    return parts
+
+
 def _limit_display_path(path: str, *, max_depth: int | None) -> str:
     """Truncate a posix-ish relative path to at most max_depth components.
 
@@ -43,8 +50,7 @@ def _limit_display_path(path: str, *, max_depth: int | None) -> str:
     """
     if max_depth is None:
         return path
-    p = PurePosixPath(path)
-    parts = list(p.parts)
+    parts = _posix_parts(path)
     if len(parts) <= 1:
         return path
     # keep first max_depth components; display as a directory rollup label
@@ -92,13 +98,19 @@ def _render_lines_ranges(
     return "\n".join(blocks).rstrip()
 
 
-def _render_source_line(sl: SourceLine, *, options: RenderOptions) -> str:
-    # Human mode: " 123: code" (or "code" if no line numbers requested/available)
-    prefix = f"{sl.line:>4}: " if options.show_line_numbers and sl.line is not None else ""
-    txt = prefix + sl.code
-    if sl.tag:
-        txt += f"  [{sl.tag}]"
-    return txt
+def _render_source_line_numbered(sl: SourceLine) -> str:
+    # Human mode: " 123: code" (or "code" if the line number is unavailable)
+    txt = sl.code if sl.line is None else f"{sl.line:>4}: {sl.code}"
+    return f"{txt}  [{sl.tag}]" if sl.tag else txt
+
+
+def _render_source_line_plain(sl: SourceLine) -> str:
+    return f"{sl.code}  [{sl.tag}]" if sl.tag else sl.code
+
+
+def _source_line_renderer(options: RenderOptions) -> Callable[[SourceLine], str]:
+    """Pick the per-line formatter once, so the snippet loop doesn't re-test the option."""
+    return _render_source_line_numbered if options.show_line_numbers else _render_source_line_plain
 
 
 def _render_lines_code_blocks(
@@ -108,18 +120,19 @@ def _render_lines_code_blocks(
 ) -> str:
     # Only render blocks if snippets are present in the model.
     blocks: list[str] = []
+    render_line = _source_line_renderer(options)
 
     for f in files:
+        # The file prefix is the same for every range of the file; build it once.
+        prefix = ""
+        if options.show_paths and f.file:
+            prefix = _limit_display_path(f.file, max_depth=options.summary_max_depth) + ":"
         for r in f.uncovered:
             if not r.source:
                 continue
             label = f"{r.start}-{r.end}" if r.start != r.end else f"{r.start}"
-            if options.show_paths and f.file:
-                fname = _limit_display_path(f.file, max_depth=options.summary_max_depth)
-                blocks.append(f"{fname}:{label}")
-            else:
-                blocks.append(label)
-            blocks.extend(_render_source_line(sl, options=options) for sl in r.source)
+            blocks.append(prefix + label)
+            blocks.extend(map(render_line, r.source))
             blocks.append("")  # blank line between ranges
 
     return "\n".join(blocks).rstrip()
@@ -199,69 +212,21 @@ def _summary_visible_files(sec: SummarySection, *, options: RenderOptions) -> li
     return files
 
 
-def _render_top_offenders(
-    files: Sequence[SummaryRow],
-    *,
-    options: RenderOptions,
-) -> str:
-    def _top_by(key_fn: Callable[[SummaryRow], tuple[int, int, str]], n: int = 10) -> list[SummaryRow]:
-        return sorted(files, key=key_fn)[:n]
-
-    top_stmt = _top_by(lambda r: (-r.statements.missed, -r.uncovered_lines, r.file))
-    top_br = _top_by(lambda r: (-r.branches.missed, -r.uncovered_lines, r.file))
-
-    def _render_top(title: str, rows_in: Sequence[SummaryRow]) -> str:
-        t = Table(show_header=True, header_style="bold")
-        t.add_column(title)
-        t.add_column("Miss stmt", justify="right")
-        t.add_column("Stmt%", justify="right")
-        t.add_column("Miss br", justify="right")
-        t.add_column("Br%", justify="right")
-        t.add_column("Uncov lines", justify="right")
-        for r in rows_in:
-            brpct = "—" if r.branch_pct is None else f"{r.branch_pct:.1f}%"
-            t.add_row(
-                r.file,
-                str(r.statements.missed),
-                f"{r.statement_pct:.1f}%",
-                str(r.branches.missed),
-                brpct,
-                str(r.uncovered_lines),
-            )
-        return render_table(t, color=options.color)
-
-    parts: list[str] = [
-        _subheading("Top offenders (statements)", options),
-        _render_top("File", top_stmt),
-        _subheading("Top offenders (branches)", options),
-        _render_top("File", top_br),
-    ]
-    return "\n".join([p for p in parts if p]).rstrip()
-
-
-def _directory_rollup_row(group: str, rows: Sequence[SummaryRow]) -> list[str]:
-    st_total = sum(r.statements.total for r in rows)
-    st_cov = sum(r.statements.covered for r in rows)
-    st_miss = sum(r.statements.missed for r in rows)
-    br_total = sum(r.branches.total for r in rows)
-    br_cov = sum(r.branches.covered for r in rows)
-    br_miss = sum(r.branches.missed for r in rows)
-    uncov = sum(r.uncovered_lines for r in rows)
-    ranges = sum(r.uncovered_ranges for r in rows)
-
-    stmt_pct = 100.0 if st_total == 0 else (st_cov / st_total) * 100.0
-    br_pct = None if br_total == 0 else (br_cov / br_total) * 100.0
-    br_pct_s = "—" if br_pct is None else f"{br_pct:.1f}%"
-
-    return [
-        group,
-        f"{stmt_pct:.1f}%",
-        str(st_miss),
-        br_pct_s,
-        str(br_miss),
-        str(uncov),
-        str(ranges),
-    ]
+def _sum_rows(rows: Iterable[SummaryRow]) -> tuple[int, int, int, int, int, int, int, int]:
+    """Sum statement/branch counts, uncovered lines and ranges over rows in a single pass."""
+    st_total = st_cov = st_miss = br_total = br_cov = br_miss = uncov = ranges = 0
+    for r in rows:
+        st = r.statements
+        bt = r.branches
+        st_total += st.total
+        st_cov += st.covered
+        st_miss += st.missed
+        br_total += bt.total
+        br_cov += bt.covered
+        br_miss += bt.missed
+        uncov += r.uncovered_lines
+        ranges += r.uncovered_ranges
+    return st_total, st_cov, st_miss, br_total, br_cov, br_miss, uncov, ranges
 
 
 @dataclass
@@ -273,8 +238,7 @@ class _DirNode:
 
 
 def _insert_file(root: _DirNode, row: SummaryRow) -> None:
-    p = PurePosixPath(row.file)
-    parts = list(p.parts)
+    parts = _posix_parts(row.file)
 
     if len(parts) <= 1:
         root.files.append(row)
@@ -307,16 +271,7 @@ def _aggregate_dir(node: _DirNode) -> SummaryRow:
 
     collect(node)
 
-    st_total = sum(r.statements.total for r in all_files)
-    st_cov = sum(r.statements.covered for r in all_files)
-    st_miss = sum(r.statements.missed for r in all_files)
-
-    br_total = sum(r.branches.total for r in all_files)
-    br_cov = sum(r.branches.covered for r in all_files)
-    br_miss = sum(r.branches.missed for r in all_files)
-
-    uncov_lines = sum(r.uncovered_lines for r in all_files)
-    uncov_ranges = sum(r.uncovered_ranges for r in all_files)
+    st_total, st_cov, st_miss, br_total, br_cov, br_miss, uncov_lines, uncov_ranges = _sum_rows(all_files)
 
     stmt_pct = pct(st_cov, st_total)
     br_pct = None if br_total == 0 else pct(br_cov, br_total)
@@ -363,7 +318,8 @@ def _tree_order_rows(root: _DirNode, *, max_depth: int | None) -> list[SummaryRo
             return
 
         dir_items = sorted(node.children.items(), key=operator.itemgetter(0))
-        file_items = sorted(node.files, key=lambda r: PurePosixPath(r.file).name)
+        # Parse each file label once; its basename is both the sort key and the display name.
+        file_items = sorted(((r.file.rpartition("/")[2], r) for r in node.files), key=operator.itemgetter(0))
 
         total_children = len(dir_items) + len(file_items)
         next_ancestor_last = ancestor_last.copy() if is_root else [*ancestor_last, is_last]
@@ -380,11 +336,10 @@ def _tree_order_rows(root: _DirNode, *, max_depth: int | None) -> list[SummaryRo
                 depth=depth + 1,
             )
 
-        for r in file_items:
+        for fname, r in file_items:
             idx += 1
             file_is_last = idx == total_children
             prefix = _tree_prefix(next_ancestor_last, is_last=file_is_last)
-            fname = PurePosixPath(r.file).name
             out.append(_with_display_file(r, prefix + fname))
 
     walk_dir(root, ancestor_last=[], is_last=True, is_root=True, depth=0)
@@ -414,6 +369,21 @@ def _with_display_file(row: SummaryRow, display: str) -> SummaryRow:
     return replace(row, file=display)
 
 
+_SUMMARY_HEADERS: tuple[tuple[str, ...], ...] = (
+    ("File",),
+    ("Stmt%",),
+    ("Statements", "Total"),
+    ("Statements", "Covered"),
+    ("Statements", "Missed"),
+    ("Br%",),
+    ("Branches", "Total"),
+    ("Branches", "Covered"),
+    ("Branches", "Missed"),
+    ("Uncov", "Lines"),
+    ("Uncov", "Ranges"),
+)
+
+
 def _render_summary_tree_table(
     files: Sequence[SummaryRow],
     *,
@@ -430,21 +400,11 @@ def _render_summary_tree_table(
         max_depth=options.summary_max_depth,
     )
 
-    headers = [
-        ("File",),
-        ("Stmt%",),
-        ("Statements", "Total"),
-        ("Statements", "Covered"),
-        ("Statements", "Missed"),
-        ("Br%",),
-        ("Branches", "Total"),
-        ("Branches", "Covered"),
-        ("Branches", "Missed"),
-        ("Uncov", "Lines"),
-        ("Uncov", "Ranges"),
-    ]
+    if not rows_in_order:
+        return ""
 
-    rows: list[list[str]] = []
+    # Rows go straight into the table; no intermediate list-of-rows is materialized.
+    table = new_table(_SUMMARY_HEADERS)
     for r in rows_in_order:
         brpct = "—" if r.branch_pct is None else f"{r.branch_pct:.1f}%"
 
@@ -453,7 +413,7 @@ def _render_summary_tree_table(
         if not label.rstrip().endswith("/"):
             label = label + ("  [untested]" if r.untested else "") + ("  [tiny]" if r.tiny else "")
 
-        rows.append([
+        table.add_row(
             label,
             f"{r.statement_pct:.1f}%",
             str(r.statements.total),
@@ -465,12 +425,10 @@ def _render_summary_tree_table(
             str(r.branches.missed),
             str(r.uncovered_lines),
             str(r.uncovered_ranges),
-        ])
+        )
 
-    table = format_table(headers, rows, color=options.color) if rows else ""
-    if not table:
-        return ""
-    return "\n".join([_subheading("Summary", options), table]).rstrip()
+    rendered = render_table(table, color=options.color)
+    return "\n".join([_subheading("Summary", options), rendered]).rstrip()
 
 
 def _render_summary_footer(sec: SummarySection) -> str:
@@ -504,36 +462,57 @@ def _render_summary_section(sec: SummarySection, *, options: RenderOptions) -> s
     return "\n".join([b for b in blocks if b]).rstrip()
 
 
-def render_human(report: Report, options: RenderOptions) -> str:
-    """Render report in a sectioned, human-friendly format.
-
-    This renderer performs no filesystem I/O; snippets must already exist in the model.
-    """
-    parts: list[str] = []
-
+def _section_parts(report: Report, options: RenderOptions) -> Iterator[str]:
+    """Yield each present section's heading and body, rendering a section only when reached."""
     for name in report.sections.present():
         if name == "lines":
             sec = report.sections.lines
             if sec is None:
                 msg = "render_human expected the lines section to be present but it is missing"
                 raise ValueError(msg)
-            parts.extend((_heading("Uncovered Lines", options), _render_lines_section(sec, options=options)))
+            yield _heading("Uncovered Lines", options)
+            yield _render_lines_section(sec, options=options)
         elif name == "branches":
             sec = report.sections.branches
             if sec is None:
                 msg = "render_human expected the branches section to be present but it is missing"
                 raise ValueError(msg)
-            parts.extend((
-                _heading("Uncovered Branches", options),
-                _render_branches_section(sec, options=options),
-            ))
+            yield _heading("Uncovered Branches", options)
+            yield _render_branches_section(sec, options=options)
         elif name == "summary":
             sec = report.sections.summary
             if sec is None:
                 msg = "render_human expected the summary section to be present but it is missing"
                 raise ValueError(msg)
-            parts.extend((_heading("Summary", options), _render_summary_section(sec, options=options)))
-    return "\n\n".join([p for p in parts if p]).rstrip()
+            yield _heading("Summary", options)
+            yield _render_summary_section(sec, options=options)
+
+
+def iter_render_human(report: Report, options: RenderOptions) -> Iterator[str]:
+    """Yield the human report in chunks; ``"".join`` of them equals ``render_human``.
+
+    Each section is rendered only when the consumer asks for it, so a writer never
+    holds the whole report as one string.
+    """
+    # Hold one part back: separators go between non-empty parts, and the report ends stripped.
+    pending: str | None = None
+    for part in _section_parts(report, options):
+        if not part:
+            continue
+        if pending is not None:
+            yield pending
+            yield "\n\n"
+        pending = part
+    if pending is not None:
+        yield pending.rstrip()
+
+
+def render_human(report: Report, options: RenderOptions) -> str:
+    """Render report in a sectioned, human-friendly format.
+
+    This renderer performs no filesystem I/O; snippets must already exist in the model.
+    """
+    return "".join(iter_render_human(report, options))
 
 
-__all__ = ["render_human"]
+__all__ = ["iter_render_human", "render_human"]
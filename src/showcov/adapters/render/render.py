@@ -3,9 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from showcov.adapters.render.human import render_human
+from showcov.adapters.render.human import iter_render_human, render_human
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
     from showcov.model.report import Report
 
 
@@ -29,6 +31,15 @@ class RenderOptions:
     summary_max_depth: int | None = None
 
 
+# Built once at import; `render` resolves a format with a single dict lookup.
+_RENDERERS: dict[str, Callable[[Report, RenderOptions], str]] = {
+    "human": render_human,
+}
+_CHUNK_RENDERERS: dict[str, Callable[[Report, RenderOptions], Iterator[str]]] = {
+    "human": iter_render_human,
+}
+
+
 def render(report: Report, *, fmt: str, options: RenderOptions) -> str:
     """Render a typed Report to text.
 
@@ -41,12 +52,23 @@ def render(report: Report, *, fmt: str, options: RenderOptions) -> str:
     options:
         Presentation options (color/tty/path display).
     """
-    f = (fmt or "").strip().lower()
+    renderer = _RENDERERS.get(fmt) or _RENDERERS.get((fmt or "").strip().lower())
+    if renderer is None:
+        msg = f"Unsupported format: {fmt!r}. Expected one of: {', '.join(_RENDERERS)}."
+        raise ValueError(msg)
+    return renderer(report, options)
 
-    if f == "human":
-        return render_human(report, options)
-    msg = f"Unsupported format: {fmt!r}. Expected one of: human."
-    raise ValueError(msg)
+
+def render_chunks(report: Report, *, fmt: str, options: RenderOptions) -> Iterator[str]:
+    """Render a typed Report lazily; ``"".join`` of the chunks equals ``render(...)``.
+
+    The format is validated up front; rendering itself runs as the chunks are consumed.
+    """
+    renderer = _CHUNK_RENDERERS.get(fmt) or _CHUNK_RENDERERS.get((fmt or "").strip().lower())
+    if renderer is None:
+        msg = f"Unsupported format: {fmt!r}. Expected one of: {', '.join(_CHUNK_RENDERERS)}."
+        raise ValueError(msg)
+    return renderer(report, options)
 
 
-__all__ = ["RenderOptions", "render"]
+__all__ = ["RenderOptions", "render", "render_chunks"]
@@ -17,10 +17,8 @@ def _header_text(parts: Sequence[str]) -> str:
     return "\n".join(items) if items else ""
 
 
-def _render_rich_table(
-    headers: Sequence[Sequence[str]], rows: Sequence[Sequence[Any]], *, color: bool
-) -> str:
-    r"""Render a Rich table captured to a string."""
+def new_table(headers: Sequence[Sequence[str]]) -> Table:
+    r"""Create an empty table with grouped headers (first column left-aligned, rest right)."""
     table = Table(show_header=True, header_style="bold")
     for h in headers:
         table.add_column(_header_text(h), justify="right")
@@ -28,7 +26,14 @@ def _render_rich_table(
     # Heuristic: left-align first column (usually file path / label)
     if table.columns:
         table.columns[0].justify = "left"
+    return table
+
 
+def _render_rich_table(
+    headers: Sequence[Sequence[str]], rows: Sequence[Sequence[Any]], *, color: bool
+) -> str:
+    r"""Render a Rich table captured to a string."""
+    table = new_table(headers)
     for r in rows:
         table.add_row(*[str(v) for v in r])
 
@@ -61,4 +66,4 @@ def render_table(table: Table, *, color: bool) -> str:
     return _render_table(table, color=color)
 
 
-__all__ = ["format_table"]
+__all__ = ["format_table", "new_table", "render_table"]
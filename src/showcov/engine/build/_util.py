@@ -1,11 +1,61 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
 from pathlib import Path
-from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from showcov.model.path_filter import PathFilter
+
+
+@dataclass(slots=True)
+class _PathMemo:
+    """Path work shared by the section builders during a single ``build_report`` call.
+
+    Labels and filter verdicts depend on the filesystem (``resolve()`` follows
+    symlinks), so they are remembered for one build only; the next build starts
+    from a fresh memo.
+    """
+
+    base: Path
+    filters: PathFilter | None = None
+    labels: dict[str, str] = field(default_factory=dict)
+    allowed: dict[str, bool] = field(default_factory=dict)
+    resolved_base: Path | None = None
+    base_resolved: bool = False
 
-def _display_path(path: str, *, base: Path) -> str:
+
+def _resolved_base(paths: _PathMemo) -> Path | None:
+    """Return ``paths.base.resolve()``, resolving it on first use (``None`` if that fails)."""
+    if not paths.base_resolved:
+        paths.base_resolved = True
+        try:
+            paths.resolved_base = paths.base.resolve()
+        except (OSError, RuntimeError):
+            paths.resolved_base = None
+    return paths.resolved_base
+
+
+# Branch gaps ask for the same file label once per line, and every section asks
+# again per file; each miss costs one `resolve()` of the file.
+def _display_path(path: str, *, paths: _PathMemo) -> str:
+    label = paths.labels.get(path)
+    if label is None:
+        label = paths.labels[path] = _compute_display_path(path, paths)
+    return label
+
+
+def _compute_display_path(path: str, paths: _PathMemo) -> str:
     p = Path(path)
     if p.is_absolute():
+        # One base per build, so label misses only pay for resolving the file itself.
+        base = _resolved_base(paths)
+        if base is None:
+            return p.as_posix()
         try:
-            return p.resolve().relative_to(base.resolve()).as_posix()
+            return p.resolve().relative_to(base).as_posix()
         except (OSError, RuntimeError, ValueError):
             return p.as_posix()
     return p.as_posix()
@@ -14,8 +64,9 @@ def _display_path(path: str, *, base: Path) -> str:
 
 
 
-def _group_consecutive(nums: Iterable[int]) -> list[tuple[int, int]]:
-    it = iter(sorted(set(nums)))
+def _group_consecutive(nums: Iterable[int], *, presorted: bool = False) -> list[tuple[int, int]]:
+    # `presorted` callers guarantee strictly increasing input, so skip the dedupe-and-sort copy.
+    it = iter(nums) if presorted else iter(sorted(set(nums)))
     out: list[tuple[int, int]] = []
     try:
         start = prev = next(it)
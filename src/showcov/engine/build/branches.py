@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from pathlib import Path
 from typing import TYPE_CHECKING, TypedDict
 
 from showcov.model.report import (
@@ -18,11 +16,11 @@ from .record_ops import (
 )
 from showcov.model.records import Record
 from ._util import (
+    _PathMemo,
     _display_path,
 )
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
-    from showcov.model.path_filter import PathFilter
+    from collections.abc import Callable
 
 class _BranchAccumulator(TypedDict):
     bc: tuple[int, int] | None
@@ -32,42 +30,40 @@ class _BranchAccumulator(TypedDict):
 def _build_branches_section(
     records: list[Record],
     *,
-    base: Path,
-    filters: PathFilter | None,
+    paths: _PathMemo,
     mode: BranchMode,
 ) -> BranchesSection:
-    files_all = sorted({r[0] for r in records})
-    files = set(_apply_filters(files_all, filters=filters))
+    # Only membership matters here, so keep the file set unsorted.
+    files = {r[0] for r in records}
+    if paths.filters:
+        files = set(_apply_filters(files, paths=paths))
     accum = _aggregate_branch_records(records, files=files)
 
+    # Resolve the mode once; the selector then runs per branch line without re-testing it.
+    select = _BRANCH_SELECTORS.get(mode, _select_missing_only)
     gaps: list[BranchGap] = []
     for (f, line), data in sorted(accum.items()):
         all_conds = tuple(data["conds"].values())
-        shown = _select_branch_conditions(all_conds, mode=mode)
+        shown = select(all_conds)
         if not shown:
             continue
-        # Stable ordering: non-line first, then line aggregate last
-        shown_sorted = tuple(
-            sorted(
-                shown,
-                key=lambda c: (
-                    1 if (c.type or "").lower() == "line" else 0,
-                    (c.type or "").lower(),
-                    c.number,
-                ),
-            )
-        )
         gaps.append(
             BranchGap(
-                file=_display_path(f, base=base),
+                file=_display_path(f, paths=paths),
                 line=line,
-                conditions=shown_sorted,
+                conditions=tuple(sorted(shown, key=_condition_sort_key)),
             )
         )
 
     return BranchesSection(gaps=tuple(gaps))
 
 
+def _condition_sort_key(c: BranchCondition) -> tuple[int, str, int]:
+    # Stable ordering: non-line first, then line aggregate last
+    typ = (c.type or "").lower()
+    return (1 if typ == "line" else 0, typ, c.number)
+
+
 def _aggregate_branch_records(
     records: list[Record],
     *,
@@ -75,6 +71,9 @@ def _aggregate_branch_records(
 ) -> dict[tuple[str, int], _BranchAccumulator]:
     by_key: dict[tuple[str, int], _BranchAccumulator] = {}
     for f, line, _hits, bc, mb, conds in records:
+        # Plain statement lines carry no branch data; don't allocate an accumulator for them.
+        if bc is None and not mb and not conds:
+            continue
         if f not in files:
             continue
         key = (f, line)
@@ -99,9 +98,12 @@ def _aggregate_branch_records(
         # merge rich conditions (including synthetic missing + line aggregate)
         cond_map = d["conds"]
         # ensure missing branches always show up as explicit "branch"/None, even if conds is empty
+        # Only build the placeholder when the key is new; setdefault would construct (and
+        # validate) a BranchCondition for every repeat of the same missing branch.
         for b in mb:
             k = ("branch", int(b))
-            cond_map.setdefault(k, BranchCondition(number=int(b), type="branch", coverage=None))
+            if k not in cond_map:
+                cond_map[k] = BranchCondition(number=int(b), type="branch", coverage=None)
 
         for c in conds:
             k = ((c.type or "branch").lower(), int(c.number))
@@ -121,26 +123,27 @@ def _merge_branch_condition(existing: BranchCondition, new: BranchCondition) ->
     return BranchCondition(number=existing.number, type=typ, coverage=cov)
 
 
-def _select_branch_conditions(
-    conds: tuple[BranchCondition, ...],
-    *,
-    mode: BranchMode,
-) -> tuple[BranchCondition, ...]:
-    if not conds:
-        return ()
-
-    def is_missing(c: BranchCondition) -> bool:
-        return c.coverage is None or c.coverage == 0
-
-    def is_partial(c: BranchCondition) -> bool:
-        return c.coverage is None or c.coverage < FULL_COVERAGE
-
-    if mode == BranchMode.ALL:
-        return conds
-    if mode == BranchMode.PARTIAL:
-        return conds if any(is_partial(c) for c in conds) else ()
-    # missing-only
-    return tuple(c for c in conds if is_missing(c))
+def _select_all(conds: tuple[BranchCondition, ...]) -> tuple[BranchCondition, ...]:
+    return conds
+
+
+def _select_partial(conds: tuple[BranchCondition, ...]) -> tuple[BranchCondition, ...]:
+    # Show the whole line when any of its conditions is not fully covered.
+    for c in conds:
+        if c.coverage is None or c.coverage < FULL_COVERAGE:
+            return conds
+    return ()
+
+
+def _select_missing_only(conds: tuple[BranchCondition, ...]) -> tuple[BranchCondition, ...]:
+    return tuple(c for c in conds if c.coverage is None or c.coverage == 0)
+
+
+_BRANCH_SELECTORS: dict[BranchMode, Callable[[tuple[BranchCondition, ...]], tuple[BranchCondition, ...]]] = {
+    BranchMode.ALL: _select_all,
+    BranchMode.PARTIAL: _select_partial,
+    BranchMode.MISSING_ONLY: _select_missing_only,
+}
 
 
 
@@ -1,19 +1,30 @@
 from __future__ import annotations
 
-from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     TypeAlias,
 )
 from showcov.model.records import Record
+from ._util import _PathMemo, _resolved_base
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
-    from showcov.model.path_filter import PathFilter
+    from collections.abc import Iterable
 
 BranchLineRec: TypeAlias = tuple[int, tuple[int, int] | None, tuple[int, ...]]
 
 
+def _group_records_by_file(records: list[Record]) -> dict[str, list[Record]]:
+    """Bucket records by file in a single pass (input order is preserved per file)."""
+    by_file: dict[str, list[Record]] = {}
+    for rec in records:
+        bucket = by_file.get(rec[0])
+        if bucket is None:
+            by_file[rec[0]] = [rec]
+        else:
+            bucket.append(rec)
+    return by_file
+
+
 
 def _deduplicate_statement_records(
     file: str,
@@ -51,7 +62,8 @@ def _deduplicate_branch_records(
             if c.number >= 0 and (c.type or "").lower() != "line":
                 max_idx_by_line[line] = max(max_idx_by_line.get(line, -1), c.number)
 
-    lines = sorted(set(br_by_line) | set(missing_by_line))
+    # Key views union straight into one set; no intermediate copy of either dict's keys.
+    lines = sorted(br_by_line.keys() | missing_by_line.keys())
     out: list[BranchLineRec] = []
     for ln in lines:
         bc_sel = br_by_line.get(ln)
@@ -69,13 +81,22 @@ def _deduplicate_branch_records(
     return out
 
 
-def _apply_filters(files: Iterable[str], *, filters: PathFilter | None) -> list[str]:
+def _apply_filters(files: Iterable[str], *, paths: _PathMemo) -> list[str]:
+    filters = paths.filters
     if not filters:
         return list(files)
-    # Keep in one place: let PathFilter do its rel/raw normalization
-    pairs = [(f, None) for f in files]
-    kept = filters.filter_files(pairs)
-    return [path for path, _ in kept]
+    # PathFilter does the rel/raw normalization; the lines, branches and summary builders
+    # each filter the same files, so every verdict is remembered for the rest of the build.
+    allowed = paths.allowed
+    base = _resolved_base(paths)
+    kept: list[str] = []
+    for f in files:
+        ok = allowed.get(f)
+        if ok is None:
+            ok = allowed[f] = filters.allow(f, resolved_base=base)
+        if ok:
+            kept.append(f)
+    return kept
 
 
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from .types import BuildOptions
+from ._util import _PathMemo
 from showcov.model.report import (
     EnvironmentMeta,
     LinesSection,
@@ -19,20 +20,23 @@ def build_report(opts: BuildOptions) -> Report:
         environment=EnvironmentMeta(coverage_xml=", ".join(str(p) for p in opts.coverage_paths)),
         options=OptionsMeta(
             context_lines=max(opts.context_before, opts.context_after),
-            with_code=bool(opts.want_snippets),
-            show_paths=bool(opts.meta_show_paths),
-            show_line_numbers=bool(opts.meta_show_line_numbers),
-            aggregate_stats=bool(opts.want_aggregate_stats),
-            file_stats=bool(opts.want_file_stats),
+            with_code=opts.want_snippets,
+            show_paths=opts.meta_show_paths,
+            show_line_numbers=opts.meta_show_line_numbers,
+            aggregate_stats=opts.want_aggregate_stats,
+            file_stats=opts.want_file_stats,
         ),
     )
 
+    # Labels and filter verdicts depend on the filesystem, so they are shared by this
+    # build's sections only.
+    paths = _PathMemo(base=opts.base_path, filters=opts.filters)
+
     # Lines (built only when needed: lines)
     lines: LinesSection | None = (
         _build_lines_section(
             records=opts.records,
-            base=opts.base_path,
-            filters=opts.filters,
+            paths=paths,
             want_aggregate_stats=opts.want_aggregate_stats,
             want_file_stats=opts.want_file_stats,
         )
@@ -44,8 +48,7 @@ def build_report(opts: BuildOptions) -> Report:
     branches = (
         _build_branches_section(
             opts.records,
-            base=opts.base_path,
-            filters=opts.filters,
+            paths=paths,
             mode=opts.branches_mode,
         )
         if "branches" in opts.sections
@@ -59,8 +62,7 @@ def build_report(opts: BuildOptions) -> Report:
         summary=(
             _build_summary_section(
                 opts.records,
-                base=opts.base_path,
-                filters=opts.filters,
+                paths=paths,
                 sort=opts.summary_sort,
             )
             if "summary" in opts.sections
@@ -5,15 +5,17 @@ from .record_ops import (
     _apply_filters,
     _deduplicate_statement_records,
     _deduplicate_branch_records,
+    _group_records_by_file,
 )
 from showcov.model.records import Record
 from ._util import (
+        _PathMemo,
         _display_path,
 )
-from dataclasses import dataclass
-from pathlib import Path
+from collections.abc import Callable
+from operator import attrgetter
 from typing import (
-TYPE_CHECKING,
+Any,
 )
 from showcov.model.metrics import pct
 from showcov.model.report import (
@@ -23,21 +25,27 @@ from showcov.model.report import (
     SummaryTotals,
 )
 from showcov.model.types import (
+FULL_COVERAGE,
 SummarySort,
 )
-from .lines import (
-    _uncovered_line_ranges,
-)
-if TYPE_CHECKING:
-    from showcov.model.path_filter import PathFilter
-
 TINY_STATEMENT_THRESHOLD = 3
-def _summary_counts_stmt(records_for_file: list[tuple[int, int]]) -> tuple[int, int, int]:
-    # records are (line,hits) for executable lines
+def _summary_counts_stmt(records_for_file: list[tuple[int, int]]) -> tuple[int, int, int, int]:
+    """Return (total, covered, missed, uncovered_ranges) in one pass.
+
+    Records are (line, hits) for executable lines, unique and sorted by line.
+    """
     total = len(records_for_file)
-    covered = sum(1 for _line, hits in records_for_file if hits > 0)
-    missed = total - covered
-    return total, covered, missed
+    covered = 0
+    ranges = 0
+    prev_missed = -2
+    for line, hits in records_for_file:
+        if hits > 0:
+            covered += 1
+        else:
+            if line != prev_missed + 1:
+                ranges += 1
+            prev_missed = line
+    return total, covered, total - covered, ranges
 
 
 def _summary_counts_br(
@@ -56,70 +64,39 @@ def _summary_counts_br(
 def _build_summary_section(
     records: list[Record],
     *,
-    base: Path,
-    filters: PathFilter | None,
+    paths: _PathMemo,
     sort: SummarySort,
 ) -> SummarySection:
-    files_all = sorted({r[0] for r in records})
-    files = _apply_filters(files_all, filters=filters)
+    # One pass to bucket records per file; per-file dedup then only scans that file's records.
+    by_file = _group_records_by_file(records)
+    files = _apply_filters(sorted(by_file), paths=paths)
 
     rows: list[SummaryRow] = [
         _build_summary_row(
             f,
-            records,
-            base=base,
+            by_file[f],
+            paths=paths,
         )
         for f in files
     ]
     _sort_summary_rows(rows, sort)
     rows_tuple = tuple(rows)
 
-    totals = _aggregate_summary_totals(rows_tuple)
-    files_with_branches = sum(1 for r in rows_tuple if r.branches.total > 0)
+    totals, files_with_branches = _aggregate_summary_totals(rows_tuple)
     return SummarySection(
         files=rows_tuple,
         totals=totals,
-        files_with_branches=int(files_with_branches),
+        files_with_branches=files_with_branches,
         total_files=len(rows_tuple),
     )
 
-@dataclass(frozen=True, slots=True)
-class _SummaryDerived:
-    uncovered_lines: int
-    uncovered_ranges: int
-    statement_pct: float
-    branch_pct: float | None
-    untested: bool
-    tiny: bool
-
-
-def _compute_summary_derived(
-    *,
-    statements: SummaryCounts,
-    branches: SummaryCounts,
-    uncovered_lines: int,
-    uncovered_ranges: int,
-) -> _SummaryDerived:
-    stmt_pct = pct(statements.covered, statements.total)
-    br_pct = None if branches.total == 0 else pct(branches.covered, branches.total)
-    untested = bool(statements.total > 0 and statements.covered == 0)
-    tiny = bool(statements.total > 0 and statements.total <= TINY_STATEMENT_THRESHOLD)
-    return _SummaryDerived(
-        uncovered_lines=int(uncovered_lines),
-        uncovered_ranges=int(uncovered_ranges),
-        statement_pct=float(stmt_pct),
-        branch_pct=(None if br_pct is None else float(br_pct)),
-        untested=bool(untested),
-        tiny=bool(tiny),
-    )
-
-
 def _build_summary_row(
     file: str,
     records: list[Record],
     *,
-    base: Path,
+    paths: _PathMemo,
 ) -> SummaryRow:
+    # `records` may be the full record list or just this file's bucket; dedup filters by file.
     # Per-line branch accounting can come from:
     # - condition-coverage => (covered,total)
     # - missing-branches (coverage.py) => ids of missing branches (may be present without condition-coverage)
@@ -127,46 +104,28 @@ def _build_summary_row(
     # When merging multiple reports, prefer the largest denominator (best fidelity). If multiple
     # inputs share that denominator, keep the maximum covered count (prevents order-dependent undercount).
     stmt_records = _deduplicate_statement_records(file, records)
-    statements = SummaryCounts(*_summary_counts_stmt(stmt_records))
+    st_total, st_covered, st_missed, uncovered_ranges = _summary_counts_stmt(stmt_records)
 
     branch_records = _deduplicate_branch_records(file, records)
-    branches = SummaryCounts(*_summary_counts_br(branch_records))
-
-    # Hotness: uncovered statement lines and uncovered ranges
-    ranges = _uncovered_line_ranges(stmt_records)
-    uncovered_lines = sum((b - a + 1) for a, b in ranges)
-    uncovered_ranges = len(ranges)
-
-    derived = _compute_summary_derived(
-        statements=statements,
-        branches=branches,
-        uncovered_lines=uncovered_lines,
-        uncovered_ranges=uncovered_ranges,
-    )
-
-    label = _display_path(file, base=base)
+    br_total, br_covered, br_missed = _summary_counts_br(branch_records)
 
+    # Hotness: every missed statement line is an uncovered line, so the count equals st_missed.
     return SummaryRow(
-        file=label,
-        statements=statements,
-        branches=branches,
-        statement_pct=derived.statement_pct,
-        branch_pct=derived.branch_pct,
-        uncovered_lines=derived.uncovered_lines,
-        uncovered_ranges=derived.uncovered_ranges,
-        untested=derived.untested,
-        tiny=derived.tiny,
+        file=_display_path(file, paths=paths),
+        statements=SummaryCounts(st_total, st_covered, st_missed),
+        branches=SummaryCounts(br_total, br_covered, br_missed),
+        statement_pct=pct(st_covered, st_total),
+        branch_pct=None if br_total == 0 else pct(br_covered, br_total),
+        uncovered_lines=st_missed,
+        uncovered_ranges=uncovered_ranges,
+        untested=st_total > 0 and st_covered == 0,
+        tiny=0 < st_total <= TINY_STATEMENT_THRESHOLD,
     )
 
 
-def _summary_statement_pct(row: SummaryRow) -> float:
-    st = row.statements
-    return pct(st.covered, st.total)
-
-
 def _summary_branch_pct(row: SummaryRow) -> float:
-    bt = row.branches
-    return pct(bt.covered, bt.total)
+    # branch_pct is None when a file has no branches; those sort as fully covered.
+    return float(FULL_COVERAGE) if row.branch_pct is None else row.branch_pct
 
 
 def _sort_key_missed_stmt(r: SummaryRow) -> tuple[int, int, str]:
@@ -182,34 +141,41 @@ def _sort_key_uncovered_lines(r: SummaryRow) -> tuple[int, int, str]:
     return (-r.uncovered_lines, -r.statements.missed, r.file)
 
 
-def _sort_summary_rows(rows: list[SummaryRow], sort: SummarySort) -> None:
+# Keys read fields precomputed on each row (label, percentages), so sorting never
+# recomputes a percentage or a display path per comparison.
+_SUMMARY_SORT_KEYS: dict[SummarySort, Callable[[SummaryRow], Any]] = {
+    SummarySort.FILE: attrgetter("file"),
+    SummarySort.STATEMENT_COVERAGE: attrgetter("statement_pct"),
+    SummarySort.BRANCH_COVERAGE: _summary_branch_pct,
+    SummarySort.MISSED_STATEMENTS: _sort_key_missed_stmt,
+    SummarySort.MISSED_BRANCHES: _sort_key_missed_br,
+    SummarySort.UNCOVERED_LINES: _sort_key_uncovered_lines,
+}
 
-    # Back-compat alias
-    if sort == SummarySort.FILE:
-        rows.sort(key=lambda r: r.file)
-    elif sort == SummarySort.STATEMENT_COVERAGE:
-        rows.sort(key=_summary_statement_pct)
-    elif sort == SummarySort.BRANCH_COVERAGE:
-        rows.sort(key=_summary_branch_pct)
-    elif sort == SummarySort.MISSED_STATEMENTS:
-        rows.sort(key=_sort_key_missed_stmt)
-    elif sort == SummarySort.MISSED_BRANCHES:
-        rows.sort(key=_sort_key_missed_br)
-    elif sort == SummarySort.UNCOVERED_LINES:
-        rows.sort(key=_sort_key_uncovered_lines)
-    else:
-        rows.sort(key=_sort_key_missed_stmt)
-
-
-def _aggregate_summary_totals(rows: tuple[SummaryRow, ...]) -> SummaryTotals:
-    st_total = sum(r.statements.total for r in rows)
-    st_cov = sum(r.statements.covered for r in rows)
-    st_miss = sum(r.statements.missed for r in rows)
-    br_total = sum(r.branches.total for r in rows)
-    br_cov = sum(r.branches.covered for r in rows)
-    br_miss = sum(r.branches.missed for r in rows)
-    return SummaryTotals(
+
+def _sort_summary_rows(rows: list[SummaryRow], sort: SummarySort) -> None:
+    rows.sort(key=_SUMMARY_SORT_KEYS.get(sort, _sort_key_missed_stmt))
+
+
+def _aggregate_summary_totals(rows: tuple[SummaryRow, ...]) -> tuple[SummaryTotals, int]:
+    """Return weighted totals plus the number of files with branches, in a single pass."""
+    st_total = st_cov = st_miss = 0
+    br_total = br_cov = br_miss = 0
+    files_with_branches = 0
+    for r in rows:
+        st = r.statements
+        bt = r.branches
+        st_total += st.total
+        st_cov += st.covered
+        st_miss += st.missed
+        br_total += bt.total
+        br_cov += bt.covered
+        br_miss += bt.missed
+        if bt.total > 0:
+            files_with_branches += 1
+    totals = SummaryTotals(
         statements=SummaryCounts(total=st_total, covered=st_cov, missed=st_miss),
         branches=SummaryCounts(total=br_total, covered=br_cov, missed=br_miss),
     )
+    return totals, files_with_branches
 
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import replace
+from functools import partial
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from showcov.model.report import FileCounts, Report, SourceLine, UncoveredFile, UncoveredRange
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Sequence
 
     from showcov.engine.build import BuildOptions
 
@@ -20,6 +25,42 @@ def read_file_lines_uncached(path: Path) -> list[str]:
         return []
 
 
+# Separators other than "\n" that str.splitlines() also breaks on.
+_EXTRA_LINE_BREAKS = re.compile(r"[\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+def count_file_lines(path: Path) -> int:
+    """Return ``len(read_file_lines_uncached(path))`` without materializing the lines."""
+    try:
+        text = path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return 0
+    if _EXTRA_LINE_BREAKS.search(text):
+        return len(text.splitlines())
+    return text.count("\n") + (1 if text and not text.endswith("\n") else 0)
+
+
+def _read_file_lines_through(path: Path, last: int) -> list[str]:
+    """Return ``read_file_lines_uncached(path)[:last]`` without reading the rest of the file."""
+    try:
+        with path.open("rb") as fh:
+            # Binary iteration splits on b"\n" only, which never occurs inside a UTF-8
+            # sequence, so the head decodes exactly as it would as part of the whole file.
+            head = b"".join(islice(fh, last))
+    except OSError:
+        return []
+    text = head.decode("utf-8", errors="replace")
+    if _EXTRA_LINE_BREAKS.search(text):
+        return text.splitlines()[:last]
+    lines = text.split("\n", last)
+    if len(lines) > last:
+        del lines[last:]
+    elif not lines[-1]:
+        # Whole file split: splitlines() yields no empty piece after a final newline.
+        lines.pop()
+    return lines
+
+
 def detect_line_tag(code: str) -> str | None:
     """Lightweight tag heuristic for human/rg snippets."""
     s = code.strip()
@@ -48,10 +89,12 @@ def _determine_context_offsets(
 
 
 def _resolve_source_path(file_label: str, *, base: Path) -> Path:
+    # No Path.resolve(): the path is only opened, and the OS already follows symlinks and
+    # ".." while opening, so canonicalizing first would just add a stat per path component.
     p = Path(file_label)
     if p.is_absolute():
         return p
-    return (base / p).resolve()
+    return base / p
 
 
 def _enrich_range(
@@ -75,7 +118,8 @@ def _enrich_range(
         code = file_lines[lineno - 1] if 1 <= lineno <= max_line else ""
         tag = detect_line_tag(code)
         src.append(SourceLine(code=code, line=(lineno if include_line_numbers else None), tag=tag))
-    return replace(r, source=tuple(src))
+    # Direct construction; dataclasses.replace() re-walks the field list for every range.
+    return UncoveredRange(start=r.start, end=r.end, source=tuple(src))
 
 
 def _enrich_file(
@@ -92,51 +136,70 @@ def _enrich_file(
         return f
 
     src_path = _resolve_source_path(f.file, base=base)
-    lines = read_file_lines_uncached(src_path)
 
     ranges = f.uncovered
+    total_lines = 0
     if want_snippets:
-        ranges = tuple(
-            _enrich_range(
-                r,
-                file_lines=lines,
-                before=before,
-                after=after,
-                include_line_numbers=include_line_numbers,
-            )
-            for r in f.uncovered
+        if want_file_stats:
+            lines = read_file_lines_uncached(src_path)
+            total_lines = len(lines)
+        else:
+            # Snippets never look past the last range's trailing context.
+            last = max((r.end for r in f.uncovered), default=0) + max(0, after)
+            lines = _read_file_lines_through(src_path, last)
+        enrich_range = partial(
+            _enrich_range,
+            file_lines=lines,
+            before=before,
+            after=after,
+            include_line_numbers=include_line_numbers,
         )
+        ranges = tuple(map(enrich_range, f.uncovered))
 
     counts = f.counts
     if want_file_stats:
-        uncovered = sum(r.line_count for r in ranges)
-        counts = FileCounts(uncovered=uncovered, total=len(lines))
+        # Without snippets only the total is needed, so count lines instead of splitting them.
+        if not want_snippets:
+            total_lines = count_file_lines(src_path)
+        # Enrichment keeps the ranges' extents, so a count from the build is still exact.
+        uncovered = f.counts.uncovered if f.counts is not None else sum(r.line_count for r in ranges)
+        counts = FileCounts(uncovered=uncovered, total=total_lines)
 
     return replace(f, uncovered=ranges, counts=counts)
 
 
+# Source reads are I/O bound; same ceiling as ThreadPoolExecutor's own default.
+_MAX_READ_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+
 def enrich_report(report: Report, opts: BuildOptions) -> Report:
     """Attach filesystem-derived data (snippets, file totals) to an already-built Report."""
     sec = report.sections
     if sec.lines is None:
         return report
 
-    include_line_numbers = bool(opts.meta_show_line_numbers)
-
-    def enrich_files(files: Iterable[UncoveredFile]) -> tuple[UncoveredFile, ...]:
-        out: list[UncoveredFile] = [
-            _enrich_file(
-                f,
-                base=opts.base_path,
-                before=opts.context_before,
-                after=opts.context_after,
-                include_line_numbers=include_line_numbers,
-                want_snippets=bool(opts.want_snippets),
-                want_file_stats=bool(opts.want_file_stats),
-            )
-            for f in files
-        ]
-        return tuple(out)
+    include_line_numbers = opts.meta_show_line_numbers
+
+    # The keyword arguments are identical for every file; bind them once.
+    enrich_file = partial(
+        _enrich_file,
+        base=opts.base_path,
+        before=opts.context_before,
+        after=opts.context_after,
+        include_line_numbers=include_line_numbers,
+        want_snippets=opts.want_snippets,
+        want_file_stats=opts.want_file_stats,
+    )
+
+    def enrich_files(files: Sequence[UncoveredFile]) -> tuple[UncoveredFile, ...]:
+        # Only snippets and file totals touch the filesystem; otherwise a pool is pure overhead.
+        reads = opts.want_snippets or opts.want_file_stats
+        workers = min(len(files), _MAX_READ_WORKERS) if reads else 1
+        if workers <= 1:
+            return tuple(map(enrich_file, files))
+        # Overlap source reads across files; `map` yields in input order, so file order is kept.
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return tuple(pool.map(enrich_file, files))
 
     new_lines = sec.lines
     if new_lines is not None:
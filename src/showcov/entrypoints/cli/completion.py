@@ -6,7 +6,6 @@ from typing import Annotated, Literal
 import click
 import typer
 from click.shell_completion import BashComplete, FishComplete, ShellComplete, ZshComplete
-from typer.main import get_command
 
 from showcov.adapters.output import write_output
 from showcov.entrypoints.cli.exit_codes import EXIT_OK
@@ -52,6 +51,7 @@ def build_completion_script(shell: ShellName, *, command: click.Command) -> str:
 def register(app: typer.Typer) -> None:
     @app.command("completion")
     def completion(
+        ctx: typer.Context,
         shell: Annotated[
             ShellName,
             typer.Argument(..., help="Shell name: bash, zsh, or fish."),
@@ -62,7 +62,7 @@ def register(app: typer.Typer) -> None:
         ],
     ) -> None:
         """Generate shell completion scripts."""
-        script = build_completion_script(shell, command=get_command(app))
+        script = build_completion_script(shell, command=ctx.find_root().command)
         write_output(script, output)
         raise typer.Exit(code=EXIT_OK)
 
@@ -7,7 +7,6 @@ from typing import Annotated
 
 import click
 import typer
-from typer.main import get_command
 
 from showcov.adapters.output import write_output
 from showcov.entrypoints.cli.exit_codes import EXIT_OK
@@ -20,6 +19,15 @@ _EXIT_STATUS = """\
 66 required coverage XML input missing
 """
 
+# Everything but the DESCRIPTION body is fixed; assemble it once.
+_MAN_HEADER = (
+    "SHOWCOV(1)\n"
+    "NAME\n----\nshowcov - unified coverage report generator\n\n"
+    "SYNOPSIS\n--------\nshowcov [COMMAND] [ARGS]...\n\n"
+    "DESCRIPTION\n-----------\n"
+)
+_MAN_FOOTER = f"\n\nEXIT STATUS\n-----------\n{_EXIT_STATUS.strip()}\n"
+
 
 def build_man_page(command: click.Command) -> str:
     """Return a plain-text manual page for showcov's CLI."""
@@ -29,31 +37,21 @@ def build_man_page(command: click.Command) -> str:
         help_text = command.get_help(ctx).strip()
     help_text = help_text or buf.getvalue().strip()
 
-    sections = [
-        "SHOWCOV(1)\n",
-        "NAME\n----\nshowcov - unified coverage report generator\n\n",
-        "SYNOPSIS\n--------\nshowcov [COMMAND] [ARGS]...\n\n",
-        "DESCRIPTION\n-----------\n",
-        help_text,
-        "\n\nEXIT STATUS\n-----------\n",
-        _EXIT_STATUS.strip(),
-        "\n",
-    ]
-    return "".join(sections)
+    return f"{_MAN_HEADER}{help_text}{_MAN_FOOTER}"
 
 
 def register(app: typer.Typer) -> None:
-    command = get_command(app)
-
     @app.command("man")
     def man(
+        ctx: typer.Context,
         output: Annotated[
             Path | None,
             typer.Option("--output", help="Write man page to PATH (use '-' for stdout)."),
         ],
     ) -> None:
         """Print a plain-text manual page."""
-        text = build_man_page(command)
+        # The running root command is the fully built CLI; no need to convert the app again.
+        text = build_man_page(ctx.find_root().command)
         write_output(text, output)
         raise typer.Exit(code=EXIT_OK)
 
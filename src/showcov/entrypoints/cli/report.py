@@ -7,7 +7,6 @@ from typing import TYPE_CHECKING, Annotated
 import click.utils as click_utils
 import typer
 
-from showcov.adapters.output import write_output
 from showcov.entrypoints.cli._shared import resolve_use_color
 from showcov.entrypoints.cli.exit_codes import (
     EXIT_DATAERR,
@@ -16,21 +15,15 @@ from showcov.entrypoints.cli.exit_codes import (
     EXIT_OK,
     EXIT_THRESHOLD,
 )
-from showcov.model.path_filter import PathFilter
-from showcov.model.thresholds import Threshold
 from showcov.model.types import BranchMode, SummarySort
-from showcov.usecases.inputs import resolve_coverage_inputs
-from showcov.usecases.pipeline import (
-    DataError,
-    NoInputError,
-    SystemIOError,
-    ThresholdError,
-    UnexpectedError,
-    evaluate_thresholds_or_raise,
-)
-from showcov.usecases.reporting import build_and_render_text
+
+# The use-case layer (XML parsing, report building, Rich rendering) is imported inside the
+# command bodies so `showcov --help`, `--version` and completion don't pay for it.
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from showcov.model.path_filter import PathFilter
     from showcov.model.report import Report
 
 _BOOL_TRUE = True
@@ -44,28 +37,33 @@ def _is_tty_stdout() -> bool:
         return False
 
 
-def _build_report_and_text(
+def _build_report_and_chunks(
     *,
     coverage_paths: tuple[Path, ...],
+    base_path: Path,
     filters: PathFilter | None,
     sections: set[str],
+    render_sections: set[str],
     want_snippets: bool,
     context: int,
     sort: SummarySort,
-    max_depth: int,
+    max_depth: int | None,
     is_tty_like: bool,
     use_color: bool,
-) -> tuple[Report, str]:
-    base_path = Path.cwd()
+    trusted_xml: bool,
+) -> tuple[Report, Iterator[str]]:
+    from showcov.usecases.pipeline import DataError, NoInputError, SystemIOError, UnexpectedError
+    from showcov.usecases.reporting import build_and_render_chunks
+
     try:
-        return build_and_render_text(
-            coverage_paths=tuple(coverage_paths),
+        return build_and_render_chunks(
+            coverage_paths=coverage_paths,
             base_path=base_path,
             filters=filters,
             sections=sections,
             branches_mode=BranchMode.PARTIAL,
             summary_sort=sort,
-            want_stats=("lines" in sections),
+            want_stats=("lines" in render_sections),
             want_file_stats=False,
             want_snippets=want_snippets,
             context_before=context,
@@ -79,6 +77,8 @@ def _build_report_and_text(
             summary_group=True,
             summary_max_depth=max_depth,
             drop_empty_branches=True,
+            render_sections=render_sections,
+            trusted_xml=trusted_xml,
         )
     except NoInputError as exc:
         typer.echo(f"ERROR: {exc}", err=True)
@@ -111,6 +111,13 @@ def report_cmd(
             help="Exclude glob patterns (repeatable).",
         ),
     ] = None,
+    exclude_dir: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--exclude-dir",
+            help="Exclude every file under this directory (repeatable; prefix match, faster than globs).",
+        ),
+    ] = None,
     coverage: Annotated[
         list[Path] | None,
         typer.Argument(help="Coverage XML file(s). If omitted, discovery is used."),
@@ -172,6 +179,16 @@ def report_cmd(
         int | None,
         typer.Option("--max-misses", help="Fail if total uncovered statement lines exceeds this value"),
     ] = None,
+    trusted_xml: Annotated[
+        bool,
+        typer.Option(
+            "--trusted-xml",
+            help=(
+                "Parse coverage XML with the plain stdlib parser instead of the hardened one, "
+                "even when lxml is installed (only for files you generated yourself)."
+            ),
+        ),
+    ] = _BOOL_FALSE,
     output: Annotated[
         Path | None,
         typer.Option("--output", help="Write output to PATH (use '-' for stdout)."),
@@ -185,10 +202,15 @@ def report_cmd(
         typer.Option("--no-color", help="Disable color output"),
     ] = _BOOL_FALSE,
 ) -> None:
+    from showcov.adapters.output import write_output
+    from showcov.model.path_filter import PathFilter
+    from showcov.usecases.inputs import resolve_coverage_inputs
+
     include = include or []
     exclude = exclude or []
-
-    coverage_paths = resolve_coverage_inputs(coverage, cwd=Path.cwd())
+    exclude_dir = exclude_dir or []
+    # One getcwd() per invocation: discovery, filters and display paths share it.
+    cwd = Path.cwd()
 
     sections: set[str] = set()
     if lines:
@@ -202,32 +224,52 @@ def report_cmd(
     if not sections:
         sections = {"summary"}
 
+    # Thresholds may need sections the user did not ask to see; build those but don't render them.
+    build_sections = sections | _threshold_sections(
+        fail_under_stmt=fail_under_stmt,
+        fail_under_branches=fail_under_branches,
+        max_misses=max_misses,
+    )
+    want_snippets = (code or context > 0) and "lines" in sections
+
+    # Option handling above is pure; discovery below is the first step that touches the filesystem.
+    coverage_paths = resolve_coverage_inputs(coverage, cwd=cwd)
+
+    exclude_dirs = _exclude_dir_prefixes(exclude_dir, base=cwd)
+
     filters = (
-        PathFilter(include=tuple(include), exclude=tuple(exclude), base=Path.cwd())
-        if (include or exclude)
+        PathFilter(
+            include=tuple(include),
+            exclude=tuple(exclude),
+            base=cwd,
+            exclude_dirs=exclude_dirs,
+        )
+        if (include or exclude or exclude_dir)
         else None
     )
 
-    want_snippets = bool(code or context > 0)
-
     is_tty_like = _is_tty_stdout() and (output is None or output == Path("-"))
-    ansi_allowed = not click_utils.should_strip_ansi(sys.stdout)
-    color_allowed = bool(is_tty_like and ansi_allowed)
+    # Only probe the stream for ANSI support when neither flag already decides the answer.
+    color_allowed = not (color or no_color) and is_tty_like and not click_utils.should_strip_ansi(sys.stdout)
     use_color = resolve_use_color(color=color, no_color=no_color, color_allowed=color_allowed)
 
     # We intentionally simplify: single console text output, no JSON, no rg/human split, no color flags.
     # For now we still render through the existing renderer (human), but we don't expose its complexity.
 
-    report, text = _build_report_and_text(
-        coverage_paths=tuple(coverage_paths),
+    # The text is rendered lazily while it is written, i.e. only once thresholds have passed.
+    report, chunks = _build_report_and_chunks(
+        coverage_paths=coverage_paths,
+        base_path=cwd,
         filters=filters,
-        sections=sections,
+        sections=build_sections,
+        render_sections=sections,
         want_snippets=want_snippets,
-        context=int(context),
+        context=context,
         sort=sort,
-        max_depth=max_depth if max_depth is None else int(max_depth),
+        max_depth=max_depth,
         is_tty_like=is_tty_like,
         use_color=use_color,
+        trusted_xml=trusted_xml,
     )
 
     _enforce_thresholds(
@@ -236,10 +278,38 @@ def report_cmd(
         fail_under_branches=fail_under_branches,
         max_misses=max_misses,
     )
-    write_output(text, output)
+    write_output(chunks, output)
     raise typer.Exit(code=EXIT_OK)
 
 
+def _exclude_dir_prefixes(exclude_dir: list[str], *, base: Path) -> tuple[str, ...]:
+    from showcov.usecases.inputs import resolve_exclude_dirs
+
+    # File labels are relative to the resolved base, so directory prefixes must be too.
+    prefixes, outside = resolve_exclude_dirs(exclude_dir, base=base)
+    for d in outside:
+        typer.echo(
+            f"WARNING: --exclude-dir {d} is outside {base}; it only matches absolute file names.",
+            err=True,
+        )
+    return prefixes
+
+
+def _threshold_sections(
+    *,
+    fail_under_stmt: float | None,
+    fail_under_branches: float | None,
+    max_misses: int | None,
+) -> set[str]:
+    # Percentages are evaluated against summary totals, misses against the lines section.
+    needed: set[str] = set()
+    if fail_under_stmt is not None or fail_under_branches is not None:
+        needed.add("summary")
+    if max_misses is not None:
+        needed.add("lines")
+    return needed
+
+
 def _enforce_thresholds(
     report: Report,
     *,
@@ -247,6 +317,8 @@ def _enforce_thresholds(
     fail_under_branches: float | None,
     max_misses: int | None,
 ) -> None:
+    from showcov.model.thresholds import Threshold
+
     thresholds: list[Threshold] = []
     if fail_under_stmt is not None:
         thresholds.append(Threshold(statement=float(fail_under_stmt)))
@@ -258,18 +330,21 @@ def _enforce_thresholds(
     if not thresholds:
         return
 
+    from showcov.usecases.pipeline import ThresholdError, evaluate_thresholds_or_raise
+
     try:
         evaluate_thresholds_or_raise(report, thresholds=thresholds)
     except ThresholdError as exc:
-        for failure in exc.result.failures:
-            typer.echo(
-                (
-                    "Threshold failed: "
-                    f"{failure.metric} {failure.comparison} {failure.required}"
-                    f" (actual {failure.actual})"
-                ),
-                err=True,
-            )
+        # One echo for all failures: a single stderr write instead of one per failure.
+        typer.echo(
+            "\n".join(
+                "Threshold failed: "
+                f"{failure.metric} {failure.comparison} {failure.required}"
+                f" (actual {failure.actual})"
+                for failure in exc.result.failures
+            ),
+            err=True,
+        )
         raise typer.Exit(code=EXIT_THRESHOLD) from exc
 
 
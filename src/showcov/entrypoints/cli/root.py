@@ -5,7 +5,6 @@ from typing import Annotated
 import typer
 from typer.main import get_command
 
-from showcov import __version__
 from showcov.entrypoints.cli import completion, man, report
 
 
@@ -21,6 +20,8 @@ def create_app() -> typer.Typer:
         ] = False,
     ) -> None:
         if version:
+            from showcov import __version__
+
             typer.echo(f"showcov {__version__}")
             raise typer.Exit
 
@@ -32,8 +33,8 @@ def create_app() -> typer.Typer:
 
 
 def main() -> None:
-    app = create_app()
-    get_command(app)()
+    # Reuse the command built at import instead of rebuilding the whole app per run.
+    cli()
 
 
 # Click-compatible object for tooling that imports it
@@ -1,10 +1,41 @@
 """Domain model for showcov (pure types + policy; no IO)."""
 
-from .metrics import pct
-from .path_filter import PathFilter
-from .report import Report
-from .thresholds import Threshold, ThresholdFailure, ThresholdsResult, evaluate, parse_threshold
-from .types import BranchMode, SummarySort
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .metrics import pct
+    from .path_filter import PathFilter
+    from .report import Report
+    from .thresholds import Threshold, ThresholdFailure, ThresholdsResult, evaluate, parse_threshold
+    from .types import BranchMode, SummarySort
+
+# Re-exports resolve on first access: importing one submodule (e.g. `showcov.model.types`
+# for a CLI option type) runs this package first and should not load the whole model.
+_EXPORTS = {  # ruff: ignore[non-empty-init-module]
+    "BranchMode": "types",
+    "PathFilter": "path_filter",
+    "Report": "report",
+    "SummarySort": "types",
+    "Threshold": "thresholds",
+    "ThresholdFailure": "thresholds",
+    "ThresholdsResult": "thresholds",
+    "evaluate": "thresholds",
+    "parse_threshold": "thresholds",
+    "pct": "metrics",
+}
+
+
+def __getattr__(name: str) -> object:
+    module = _EXPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = globals()[name] = getattr(import_module(f".{module}", __name__), name)
+    return value
+
 
 __all__ = [
     "BranchMode",
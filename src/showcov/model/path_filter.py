@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from fnmatch import fnmatch
+import os
+import re
+from dataclasses import dataclass, field
+from fnmatch import translate
 from pathlib import Path
 from typing import TYPE_CHECKING, TypeVar
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Callable, Iterable, Sequence
 
 T = TypeVar("T")
 
@@ -30,7 +32,7 @@ def _coerce_patterns(items: Sequence[str | Path]) -> tuple[str, ...]:
     pats: list[str] = []
     for it in items:
         if isinstance(it, Path):
-            pats.extend(_load_patterns(it) if it.exists() and it.is_file() else [str(it)])
+            pats.extend(_load_patterns(it) if it.is_file() else [str(it)])
         else:
             pats.append(str(it))
     # de-dupe, preserve order
@@ -43,6 +45,31 @@ def _coerce_patterns(items: Sequence[str | Path]) -> tuple[str, ...]:
     return tuple(out)
 
 
+def _dir_prefixes(dirs: Sequence[str | Path]) -> tuple[str, ...]:
+    """Normalize directories to ``"a/b/"`` prefixes so ``a/bc.py`` doesn't match ``a/b``."""
+    out: list[str] = []
+    for d in dirs:
+        s = Path(d).as_posix().rstrip("/")
+        if s and s != ".":
+            out.append(os.path.normcase(s) + "/")
+    return tuple(dict.fromkeys(out))
+
+
+def _compile_globs(patterns: tuple[str, ...]) -> Callable[[str], re.Match[str] | None] | None:
+    """Compile globs into one alternation regex with ``fnmatch`` semantics (incl. normcase)."""
+    if not patterns:
+        return None
+    union = "|".join(f"(?:{translate(os.path.normcase(p))})" for p in patterns)
+    return re.compile(union).match
+
+
+def _resolve_or_none(base: Path) -> Path | None:
+    try:
+        return base.resolve()
+    except (OSError, RuntimeError):
+        return None
+
+
 @dataclass(frozen=True, slots=True)
 class PathFilter:
     """Simple include/exclude filter for file paths.
@@ -50,11 +77,20 @@ class PathFilter:
     Patterns are treated as globs matched against:
       - the base-relative posix path (preferred)
       - the raw posix path (fallback)
+
+    ``exclude_dirs`` are plain directory prefixes checked the same way with
+    ``str.startswith``, which skips glob matching for the common "drop this tree" case.
+
+    The filter keeps no filesystem state: the resolved ``base`` is passed to
+    ``allow`` by the caller (once per report build) or resolved on each call.
     """
 
     include: tuple[str, ...]
     exclude: tuple[str, ...]
     base: Path
+    exclude_dirs: tuple[str, ...]
+    _include_match: Callable[[str], re.Match[str] | None] | None = field(repr=False, compare=False)
+    _exclude_match: Callable[[str], re.Match[str] | None] | None = field(repr=False, compare=False)
 
     def __init__(
         self,
@@ -62,44 +98,61 @@ class PathFilter:
         exclude: Sequence[str | Path] = (),
         *,
         base: Path,
+        exclude_dirs: Sequence[str | Path] = (),
     ) -> None:
         object.__setattr__(self, "include", _coerce_patterns(tuple(include)))
         object.__setattr__(self, "exclude", _coerce_patterns(tuple(exclude)))
         object.__setattr__(self, "base", base)
+        object.__setattr__(self, "exclude_dirs", _dir_prefixes(exclude_dirs))
+        # Match each label against all patterns in a single regex call instead of one
+        # fnmatch() per pattern.
+        object.__setattr__(self, "_include_match", _compile_globs(self.include))
+        object.__setattr__(self, "_exclude_match", _compile_globs(self.exclude))
 
-    def _labels(self, path: str | Path) -> tuple[str, str]:
+    def _labels(self, path: str | Path, base: Path | None) -> tuple[str, str]:
         p = Path(path)
+        raw = p.as_posix()
+        if base is None:
+            return raw, raw
         try:
             rel = p if p.is_absolute() else (self.base / p)
-            rel = rel.resolve().relative_to(self.base.resolve())
-            rel_s = rel.as_posix()
+            rel_s = rel.resolve().relative_to(base).as_posix()
         except (OSError, RuntimeError, ValueError):
-            rel_s = p.as_posix()
-        raw = p.as_posix()
+            rel_s = raw
         return rel_s, raw
 
-    def allow(self, path: str | Path) -> bool:
-        rel_s, raw = self._labels(path)
+    def allow(self, path: str | Path, *, resolved_base: Path | None = None) -> bool:
+        """Return whether ``path`` passes the filter.
+
+        ``resolved_base`` is ``base.resolve()``; callers checking many paths resolve it
+        once and pass it in, otherwise it is resolved here.
+        """
+        if resolved_base is None:
+            resolved_base = _resolve_or_none(self.base)
+        rel_s, raw = self._labels(path, resolved_base)
+        rel_s = os.path.normcase(rel_s)
+        raw = os.path.normcase(raw)
+
+        # directory excludes: a prefix test on both labels, no glob matching
+        dirs = self.exclude_dirs
+        if dirs and (rel_s.startswith(dirs) or raw.startswith(dirs)):
+            return False
 
         # includes: if specified, must match at least one
-        if self.include:
-            ok = any(fnmatch(rel_s, pat) or fnmatch(raw, pat) for pat in self.include)
-            if not ok:
-                return False
+        inc = self._include_match
+        if inc is not None and not (inc(rel_s) or inc(raw)):
+            return False
 
         # excludes: if any match, reject
-        if self.exclude:
-            bad = any(fnmatch(rel_s, pat) or fnmatch(raw, pat) for pat in self.exclude)
-            if bad:
-                return False
-
-        return True
+        exc = self._exclude_match
+        return exc is None or not (exc(rel_s) or exc(raw))
 
     def filter_files(self, files: Iterable[tuple[str, T]]) -> list[tuple[str, T]]:
         """Filter (path, payload) pairs whose path is allowed."""
+        resolved_base = _resolve_or_none(self.base)
         out: list[tuple[str, T]] = []
         for path, payload in files:
-            if self.allow(path):
+            if self.allow(path, resolved_base=resolved_base):
                 out.append((path, payload))
         return out
 
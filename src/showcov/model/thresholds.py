@@ -1,18 +1,29 @@
 from __future__ import annotations
 
+import operator
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from showcov.model.metrics import pct
 from showcov.model.types import FULL_COVERAGE
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
     from showcov.model.report import LinesSection, Report
 
 _THRESHOLD_PATTERN = re.compile(r"^[a-zA-Z_-]+=")
+_THRESHOLD_SEPARATORS = re.compile(r"[,\s]+")
+
+# (Threshold field / failure metric, predicate that flags a failure, comparison shown to users)
+# in reporting order: statement failures first, then branch, then misses.
+_CHECKS: tuple[tuple[str, Callable[[float, float], bool], str], ...] = (
+    ("statement", operator.lt, ">="),
+    ("branch", operator.lt, ">="),
+    ("misses", operator.gt, "<="),
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -55,8 +66,12 @@ class ThresholdsResult:
     failures: list[ThresholdFailure]
 
 
+@lru_cache(maxsize=64)
 def parse_threshold(expression: str) -> Threshold:
-    """Parse a threshold expression like 'statements=90,branches=80,misses=10'."""
+    """Parse a threshold expression like 'statements=90,branches=80,misses=10'.
+
+    Results are cached per expression; ``Threshold`` is frozen, so sharing them is safe.
+    """
     if not expression or not expression.strip():
         msg = "threshold expression must be non-empty"
         raise ValueError(msg)
@@ -65,7 +80,7 @@ def parse_threshold(expression: str) -> Threshold:
     br: float | None = None
     miss: int | None = None
 
-    tokens = [token.strip() for token in re.split(r"[,\s]+", expression) if token.strip()]
+    tokens = [token.strip() for token in _THRESHOLD_SEPARATORS.split(expression) if token.strip()]
     for token in tokens:
         if "=" not in token or not _THRESHOLD_PATTERN.match(token):
             msg = f"invalid threshold token: {token!r}"
@@ -137,88 +152,23 @@ def evaluate(report: Report, thresholds: Sequence[Threshold]) -> ThresholdsResul
             raise ValueError(msg)
         miss_total = _count_line_misses(lines)
 
-    if need_stmt:
-        failures.extend(_evaluate_statement_thresholds(thresholds, stmt_pct))
-    if need_br:
-        failures.extend(_evaluate_branch_thresholds(thresholds, br_pct))
-    if need_miss:
-        failures.extend(_evaluate_miss_thresholds(thresholds, miss_total))
-
-    return ThresholdsResult(passed=not failures, failures=failures)
-
-
-def _evaluate_statement_thresholds(
-    thresholds: Sequence[Threshold], stmt_pct: float | None
-) -> list[ThresholdFailure]:
-    actual = _require_percentage(stmt_pct, "statement")
-    failures: list[ThresholdFailure] = []
-    for t in thresholds:
-        if t.statement is None:
+    actuals: dict[str, float | int | None] = {
+        "statement": stmt_pct if need_stmt else None,
+        "branch": br_pct if need_br else None,
+        "misses": miss_total if need_miss else None,
+    }
+    for metric, fails, comparison in _CHECKS:
+        actual = actuals[metric]
+        if actual is None:
             continue
-        if actual < t.statement:
-            failures.append(
-                ThresholdFailure(
-                    metric="statement",
-                    required=t.statement,
-                    actual=actual,
-                    comparison=">=",
+        for t in thresholds:
+            required = getattr(t, metric)
+            if required is not None and fails(actual, required):
+                failures.append(
+                    ThresholdFailure(metric=metric, required=required, actual=actual, comparison=comparison)
                 )
-            )
-    return failures
 
-
-def _evaluate_branch_thresholds(
-    thresholds: Sequence[Threshold], br_pct: float | None
-) -> list[ThresholdFailure]:
-    actual = _require_percentage(br_pct, "branch")
-    failures: list[ThresholdFailure] = []
-    for t in thresholds:
-        if t.branch is None:
-            continue
-        if actual < t.branch:
-            failures.append(
-                ThresholdFailure(
-                    metric="branch",
-                    required=t.branch,
-                    actual=actual,
-                    comparison=">=",
-                )
-            )
-    return failures
-
-
-def _evaluate_miss_thresholds(
-    thresholds: Sequence[Threshold], miss_total: int | None
-) -> list[ThresholdFailure]:
-    actual = _require_count(miss_total, "miss")
-    failures: list[ThresholdFailure] = []
-    for t in thresholds:
-        if t.misses is None:
-            continue
-        if actual > t.misses:
-            failures.append(
-                ThresholdFailure(
-                    metric="misses",
-                    required=t.misses,
-                    actual=actual,
-                    comparison="<=",
-                )
-            )
-    return failures
-
-
-def _require_percentage(value: float | None, metric: str) -> float:
-    if value is None:
-        msg = f"internal error: {metric} percentage was not computed for threshold evaluation"
-        raise RuntimeError(msg)
-    return value
-
-
-def _require_count(value: int | None, metric: str) -> int:
-    if value is None:
-        msg = f"internal error: {metric} count was not computed for threshold evaluation"
-        raise RuntimeError(msg)
-    return value
+    return ThresholdsResult(passed=not failures, failures=failures)
 
 
 def _parse_percentage(value: str, *, existing: float | None, token: str) -> float:
@@ -253,6 +203,9 @@ def _parse_int(value: str, *, existing: int | None, token: str) -> int:
 
 def _count_line_misses(lines_section: LinesSection) -> int:
     # Typed as `LinesSection` from model.report, but kept unimported to avoid cycles.
+    # The builder already totals uncovered lines when aggregate stats are on; reuse it.
+    if lines_section.summary is not None:
+        return lines_section.summary.uncovered
     total = 0
     for f in lines_section.files:
         for r in f.uncovered:
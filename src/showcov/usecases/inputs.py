@@ -6,3 +6,33 @@ from showcov.adapters.coverage.discover import resolve_coverage_paths as _resolv
 
 def resolve_coverage_inputs(cov_paths: Sequence[Path] | None, *, cwd: Path) -> tuple[Path, ...]:
     return _resolve(cov_paths, cwd=cwd)
+
+
+def resolve_exclude_dirs(
+    dirs: Sequence[str | Path], *, base: Path
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Spell ``--exclude-dir`` values relative to ``base``, the way file labels are.
+
+    Absolute and ``..`` spellings of a directory under ``base`` become the same prefix
+    as its plain relative spelling. Returns ``(prefixes, outside)``: directories that do
+    not lie under ``base`` are kept as resolved absolute paths (they can still match
+    absolute file names) and are also listed in ``outside`` so the caller can warn.
+    """
+    try:
+        resolved_base = base.resolve()
+    except (OSError, RuntimeError):
+        return tuple(str(d) for d in dirs), ()
+    prefixes: list[str] = []
+    outside: list[str] = []
+    for d in dirs:
+        try:
+            target = (base / d).resolve()
+        except (OSError, RuntimeError):
+            prefixes.append(str(d))
+            continue
+        try:
+            prefixes.append(target.relative_to(resolved_base).as_posix())
+        except ValueError:
+            prefixes.append(target.as_posix())
+            outside.append(str(d))
+    return tuple(prefixes), tuple(outside)
@@ -102,9 +102,10 @@ def build_report_from_coverage(
     show_paths: bool,
     show_line_numbers: bool,
     drop_empty_branches: bool,
+    trusted_xml: bool = False,
 ) -> Report:
     try:
-        records = collect_cobertura_records(coverage_paths)
+        records = collect_cobertura_records(coverage_paths, trusted=trusted_xml)
         opts = _make_build_options(
             coverage_paths=coverage_paths,
             base_path=base_path,
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
-from showcov.adapters.render.render import RenderOptions, render
+from showcov.adapters.render.render import RenderOptions, render_chunks
 from showcov.usecases.pipeline import build_report_from_coverage
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
     from showcov.model.path_filter import PathFilter
@@ -13,7 +15,7 @@ if TYPE_CHECKING:
     from showcov.model.types import BranchMode, SummarySort
 
 
-def build_and_render_text(
+def build_and_render_chunks(
     *,
     coverage_paths: tuple[Path, ...],
     base_path: Path,
@@ -35,7 +37,17 @@ def build_and_render_text(
     summary_group: bool,
     summary_max_depth: int | None,
     drop_empty_branches: bool,
-) -> tuple[Report, str]:
+    render_sections: set[str] | None = None,
+    trusted_xml: bool = False,
+) -> tuple[Report, Iterator[str]]:
+    """Build a report and return it with a lazy rendering of it.
+
+    The report is built eagerly; the text is rendered section by section as the returned
+    iterator is consumed, so callers can decide (e.g. on thresholds) before paying for it.
+    ``render_sections`` limits which built sections are rendered; the returned report
+    keeps every built section (e.g. ones built only for threshold evaluation).
+    ``trusted_xml`` skips the hardened XML parser for user-owned coverage files.
+    """
     report = build_report_from_coverage(
         coverage_paths=coverage_paths,
         base_path=base_path,
@@ -51,6 +63,7 @@ def build_and_render_text(
         show_paths=show_paths,
         show_line_numbers=show_line_numbers,
         drop_empty_branches=drop_empty_branches,
+        trusted_xml=trusted_xml,
     )
 
     render_opts = RenderOptions(
@@ -62,7 +75,74 @@ def build_and_render_text(
         summary_group=summary_group,
         summary_max_depth=summary_max_depth,
     )
-    return report, render(report, fmt=render_fmt, options=render_opts)
+    shown = report if render_sections is None else _only_sections(report, render_sections)
+    return report, render_chunks(shown, fmt=render_fmt, options=render_opts)
+
+
+def build_and_render_text(
+    *,
+    coverage_paths: tuple[Path, ...],
+    base_path: Path,
+    filters: PathFilter | None,
+    sections: set[str],
+    branches_mode: BranchMode,
+    summary_sort: SummarySort,
+    want_stats: bool,
+    want_file_stats: bool,
+    want_snippets: bool,
+    context_before: int,
+    context_after: int,
+    show_paths: bool,
+    show_line_numbers: bool,
+    render_fmt: str,
+    is_tty_like: bool,
+    color: bool,
+    show_covered: bool,
+    summary_group: bool,
+    summary_max_depth: int | None,
+    drop_empty_branches: bool,
+    render_sections: set[str] | None = None,
+    trusted_xml: bool = False,
+) -> tuple[Report, str]:
+    """Build a report and render it to a single string (see ``build_and_render_chunks``)."""
+    report, chunks = build_and_render_chunks(
+        coverage_paths=coverage_paths,
+        base_path=base_path,
+        filters=filters,
+        sections=sections,
+        branches_mode=branches_mode,
+        summary_sort=summary_sort,
+        want_stats=want_stats,
+        want_file_stats=want_file_stats,
+        want_snippets=want_snippets,
+        context_before=context_before,
+        context_after=context_after,
+        show_paths=show_paths,
+        show_line_numbers=show_line_numbers,
+        render_fmt=render_fmt,
+        is_tty_like=is_tty_like,
+        color=color,
+        show_covered=show_covered,
+        summary_group=summary_group,
+        summary_max_depth=summary_max_depth,
+        drop_empty_branches=drop_empty_branches,
+        render_sections=render_sections,
+        trusted_xml=trusted_xml,
+    )
+    return report, "".join(chunks)
+
+
+def _only_sections(report: Report, names: set[str]) -> Report:
+    sec = report.sections
+    return replace(
+        report,
+        sections=replace(
+            sec,
+            lines=sec.lines if "lines" in names else None,
+            branches=sec.branches if "branches" in names else None,
+            summary=sec.summary if "summary" in names else None,
+        ),
+    )
 
 
-__all__ = ["build_and_render_text"]
+__all__ = ["build_and_render_chunks", "build_and_render_text"]
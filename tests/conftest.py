@@ -122,3 +122,11 @@ def project(tmp_path: Path) -> dict[str, Path]:
         "class C:\n    pass\n",
     )
     return {"root": tmp_path, "mod": tmp_path / "pkg/mod.py", "other": tmp_path / "pkg/other.py"}
+
+
+@pytest.fixture
+def without_lxml(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Parse coverage XML as a default install does, even when lxml is importable."""
+    from showcov.adapters.coverage import cobertura
+
+    monkeypatch.setattr(cobertura, "_lxml_etree", None)
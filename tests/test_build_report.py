@@ -291,3 +291,173 @@ def test_summary_merges_branch_counts_max_covered_when_denominator_equal(project
     assert row.branches.total == 2
     assert row.branches.covered == 2
     assert row.branches.missed == 0
+
+
+def test_summary_sort_by_coverage_treats_branchless_files_as_full() -> None:
+    from showcov.engine.build import summary as summary_mod
+    from showcov.model.report import SummaryCounts, SummaryRow
+
+    def row(name: str, stmt_pct: float, branch_pct: float | None) -> SummaryRow:
+        return SummaryRow(
+            file=name,
+            statements=SummaryCounts(0, 0, 0),
+            branches=SummaryCounts(0, 0, 0),
+            statement_pct=stmt_pct,
+            branch_pct=branch_pct,
+        )
+
+    rows = [row("a.py", 90.0, None), row("b.py", 50.0, 75.0), row("c.py", 70.0, 20.0)]
+
+    summary_mod._sort_summary_rows(rows, SummarySort.STATEMENT_COVERAGE)
+    assert [r.file for r in rows] == ["b.py", "c.py", "a.py"]
+
+    summary_mod._sort_summary_rows(rows, SummarySort.BRANCH_COVERAGE)
+    assert [r.file for r in rows] == ["c.py", "b.py", "a.py"]
+
+
+def test_internal_branch_accumulator_skips_statement_only_lines() -> None:
+    from showcov.engine.build import branches as branches_mod
+
+    records = [
+        ("pkg/mod.py", 1, 1, None, (), ()),
+        ("pkg/mod.py", 2, 0, None, (0,), ()),
+    ]
+    accum = branches_mod._aggregate_branch_records(records, files={"pkg/mod.py"})
+    assert list(accum) == [("pkg/mod.py", 2)]
+
+
+def test_internal_lines_section_counts_interleaved_files(tmp_path: Path) -> None:
+    from showcov.engine.build import lines as lines_mod
+
+    records = [
+        ("b.py", 1, 0, None, (), ()),
+        ("a.py", 4, 0, None, (), ()),
+        ("b.py", 2, 0, None, (), ()),
+        ("a.py", 5, 0, None, (), ()),
+        ("a.py", 7, 1, None, (), ()),
+        ("c.py", 1, 1, None, (), ()),
+        ("b.py", 9, 0, None, (), ()),
+    ]
+    section = lines_mod._build_lines_section(
+        records,
+        paths=lines_mod._PathMemo(base=tmp_path),
+        want_aggregate_stats=True,
+        want_file_stats=True,
+    )
+
+    assert [(f.file, [(r.start, r.end) for r in f.uncovered]) for f in section.files] == [
+        ("a.py", [(4, 5)]),
+        ("b.py", [(1, 2), (9, 9)]),
+    ]
+    assert [f.counts.uncovered for f in section.files if f.counts] == [2, 3]
+    assert section.summary is not None
+    assert section.summary.uncovered == 5
+
+
+def test_model_package_reexports_resolve_to_submodule_objects() -> None:
+    import pytest
+
+    from showcov import model
+    from showcov.model import path_filter, report, thresholds, types
+
+    assert model.PathFilter is path_filter.PathFilter
+    assert model.Report is report.Report
+    assert model.parse_threshold is thresholds.parse_threshold
+    assert model.SummarySort is types.SummarySort
+    for name in model.__all__:
+        assert getattr(model, name) is not None
+    with pytest.raises(AttributeError):
+        _ = model.NotAThing
+
+
+def test_internal_branch_selectors_per_mode() -> None:
+    from showcov.engine.build import branches as branches_mod
+    from showcov.model.report import BranchCondition
+
+    full = BranchCondition(number=0, type="jump", coverage=100)
+    half = BranchCondition(number=1, type="jump", coverage=50)
+    none = BranchCondition(number=2, type="jump", coverage=0)
+    selectors = branches_mod._BRANCH_SELECTORS
+
+    assert selectors[BranchMode.ALL]((full,)) == (full,)
+    assert selectors[BranchMode.PARTIAL]((full, half)) == (full, half)
+    assert selectors[BranchMode.PARTIAL]((full,)) == ()
+    assert selectors[BranchMode.MISSING_ONLY]((full, half, none)) == (none,)
+
+
+def test_build_report_relabels_files_after_symlink_change(tmp_path: Path) -> None:
+    from pathlib import Path
+
+    project = tmp_path / "proj"
+    (project / "pkg").mkdir(parents=True)
+    (project / "pkg" / "mod.py").write_text("x = 1\n", encoding="utf-8")
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    (elsewhere / "mod.py").write_text("x = 1\n", encoding="utf-8")
+    link = tmp_path / "link"
+    link.symlink_to(project / "pkg")
+
+    file = str(link / "mod.py")
+    opts = BuildOptions(
+        coverage_paths=(),
+        base_path=project,
+        filters=None,
+        sections={"summary"},
+        branches_mode=BranchMode.PARTIAL,
+        summary_sort=SummarySort.FILE,
+        want_aggregate_stats=False,
+        want_file_stats=False,
+        want_snippets=False,
+        context_before=0,
+        context_after=0,
+        records=[(file, 1, 0, None, (), ())],
+    )
+
+    def labels() -> list[str]:
+        summary = build_report(opts).sections.summary
+        assert summary is not None
+        return [row.file for row in summary.files]
+
+    assert labels() == ["pkg/mod.py"]
+    link.unlink()
+    link.symlink_to(elsewhere)
+    # Labels are memoized per build, so the second build sees the new link target.
+    assert labels() == [Path(file).as_posix()]
+
+
+def test_build_report_filters_each_file_once_per_build(tmp_path: Path, monkeypatch) -> None:
+    calls: list[object] = []
+    allow = PathFilter.allow
+
+    def counting_allow(self: PathFilter, path: str | Path, **kwargs) -> bool:
+        calls.append(path)
+        return allow(self, path, **kwargs)
+
+    monkeypatch.setattr(PathFilter, "allow", counting_allow)
+    opts = BuildOptions(
+        coverage_paths=(),
+        base_path=tmp_path,
+        filters=PathFilter(include=["pkg/*"], base=tmp_path),
+        sections={"lines", "branches", "summary"},
+        branches_mode=BranchMode.PARTIAL,
+        summary_sort=SummarySort.FILE,
+        want_aggregate_stats=False,
+        want_file_stats=False,
+        want_snippets=False,
+        context_before=0,
+        context_after=0,
+        records=[
+            ("pkg/a.py", 1, 0, (1, 2), (2,), ()),
+            ("other/b.py", 1, 0, (1, 2), (2,), ()),
+        ],
+    )
+
+    # The lines, branches and summary builders share one verdict per file.
+    report = build_report(opts)
+    assert report.sections.summary is not None
+    assert [row.file for row in report.sections.summary.files] == ["pkg/a.py"]
+    assert sorted(calls) == ["other/b.py", "pkg/a.py"]
+
+    # Verdicts are not kept on the filter, so the next build asks again.
+    build_report(opts)
+    assert len(calls) == 4
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import pathlib
 
+import pytest
 from click.testing import CliRunner
 
 from showcov.entrypoints.cli import cli
@@ -139,3 +140,232 @@ def test_cli_report_max_depth_1_top_level_only(project) -> None:
     assert "sub/" not in result.output
     # and the file under it should not show
     assert "a.py" not in result.output
+
+
+def test_cli_report_output_creates_missing_parent(project) -> None:
+    from tests.conftest import write_cobertura_xml
+
+    root = project["root"]
+    cov = write_cobertura_xml(
+        root,
+        "coverage.xml",
+        classes=[{"filename": "pkg/mod.py", "lines": [{"number": 2, "hits": 0}]}],
+    )
+    out = root / "reports" / "nested" / "showcov.txt"
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["report", str(cov), "--output", str(out)])
+    assert result.exit_code == 0, result.output
+    assert "mod.py" in out.read_text(encoding="utf-8")
+
+
+def test_cli_thresholds_build_hidden_sections_without_rendering_them(project) -> None:
+    from tests.conftest import write_cobertura_xml
+
+    root = project["root"]
+    cov = write_cobertura_xml(
+        root,
+        "coverage.xml",
+        classes=[{"filename": "pkg/mod.py", "lines": [{"number": 1, "hits": 1}, {"number": 2, "hits": 0}]}],
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["report", str(cov), "--max-misses", "0"])
+    assert result.exit_code == 2, result.output
+    assert "Threshold failed: misses" in result.output
+    assert "Uncovered Lines" not in result.output
+
+    result = runner.invoke(cli, ["report", str(cov), "--lines", "--no-summary", "--fail-under-stmt", "10"])
+    assert result.exit_code == 0, result.output
+    assert "Uncovered Lines" in result.output
+    assert "Summary" not in result.output
+
+
+@pytest.mark.parametrize(
+    ("flags", "backend"),
+    [([], "_iterparse_line_records"), (["--trusted-xml"], "_trusted_line_records")],
+    ids=["defusedxml", "trusted"],
+)
+def test_cli_report_without_lxml(project, monkeypatch, without_lxml, flags, backend) -> None:
+    from showcov.adapters.coverage import cobertura
+    from tests.conftest import write_cobertura_xml
+
+    root = project["root"]
+    cov = write_cobertura_xml(
+        root,
+        "coverage.xml",
+        classes=[
+            {
+                "filename": "pkg/mod.py",
+                "lines": [
+                    {"number": 1, "hits": 1},
+                    {"number": 2, "hits": 0},
+                    {
+                        "number": 3,
+                        "hits": 1,
+                        "branch": True,
+                        "condition_coverage": "50% (1/2)",
+                        "missing_branches": "5",
+                    },
+                ],
+            }
+        ],
+    )
+    monkeypatch.chdir(root)
+
+    calls: list[object] = []
+    parse = getattr(cobertura, backend)
+
+    def spy(path):
+        calls.append(path)
+        return parse(path)
+
+    monkeypatch.setattr(cobertura, backend, spy)
+    result = CliRunner().invoke(cli, ["report", str(cov), "--lines", "--branches", *flags])
+    assert result.exit_code == 0, result.output
+    assert calls == [cov]
+    assert "pkg/mod.py" in result.output
+    assert "Uncovered Lines" in result.output
+    assert "Total uncovered lines: 1" in result.output
+    assert "branch#5" in result.output
+
+
+def test_write_output_stdout_appends_newline(capsys) -> None:
+    from showcov.adapters.output import write_output
+
+    print("before")
+    write_output("héllo │ report", None)
+    assert capsys.readouterr().out == "before\nhéllo │ report\n"
+
+
+def test_write_output_file_round_trips_large_text(tmp_path) -> None:
+    from showcov.adapters.output import write_output
+
+    text = "│ ünïcode line\n" * 20_000
+    out = tmp_path / "report.txt"
+    write_output(text, out)
+    assert out.read_text(encoding="utf-8") == text
+
+
+def test_write_output_writes_chunks_in_order(tmp_path, capsys) -> None:
+    from showcov.adapters.output import write_output
+
+    chunks = ["Summary", "\n\n", "│ ünïcode"]
+    write_output(iter(chunks), None)
+    assert capsys.readouterr().out == "Summary\n\n│ ünïcode\n"
+
+    out = tmp_path / "report.txt"
+    write_output(iter(chunks), out)
+    assert out.read_text(encoding="utf-8") == "".join(chunks)
+
+
+def test_write_output_render_failure_leaves_file_untouched(tmp_path) -> None:
+    from showcov.adapters.output import write_output
+
+    def chunks():
+        yield "Summary"
+        msg = "renderer failed"
+        raise RuntimeError(msg)
+
+    out = tmp_path / "report.txt"
+    out.write_text("previous report", encoding="utf-8")
+    with pytest.raises(RuntimeError, match="renderer failed"):
+        write_output(chunks(), out)
+    assert out.read_text(encoding="utf-8") == "previous report"
+
+    missing = tmp_path / "new" / "report.txt"
+    with pytest.raises(RuntimeError, match="renderer failed"):
+        write_output(chunks(), missing)
+    assert not missing.parent.exists()
+
+
+def test_cli_threshold_failure_skips_rendering(project, monkeypatch) -> None:
+    from showcov.adapters.render import human
+    from tests.conftest import write_cobertura_xml
+
+    def _fail(*_args, **_kwargs):
+        msg = "rendered despite failing thresholds"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(human, "_render_summary_section", _fail)
+    cov = write_cobertura_xml(
+        project["root"],
+        "coverage.xml",
+        classes=[{"filename": "pkg/mod.py", "lines": [{"number": 1, "hits": 0}]}],
+    )
+
+    result = CliRunner().invoke(cli, ["report", str(cov), "--fail-under-stmt", "90"])
+    assert result.exit_code == 2, result.output
+    assert "Threshold failed" in result.output
+
+
+def test_cli_threshold_failures_reported_one_per_line(project) -> None:
+    from tests.conftest import write_cobertura_xml
+
+    root = project["root"]
+    cov = write_cobertura_xml(
+        root,
+        "coverage.xml",
+        classes=[{"filename": "pkg/mod.py", "lines": [{"number": 1, "hits": 1}, {"number": 2, "hits": 0}]}],
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["report", str(cov), "--fail-under-stmt", "90", "--max-misses", "0"])
+    assert result.exit_code == 2
+    failures = [ln for ln in result.output.splitlines() if ln.startswith("Threshold failed")]
+    assert failures == [
+        "Threshold failed: statement >= 90.0 (actual 50.0)",
+        "Threshold failed: misses <= 0 (actual 1)",
+    ]
+
+
+def test_cli_report_exclude_dir(project, monkeypatch) -> None:
+    from tests.conftest import write_cobertura_xml
+
+    root = project["root"]
+    cov = write_cobertura_xml(
+        root,
+        "coverage.xml",
+        classes=[
+            {"filename": "pkg/mod.py", "lines": [{"number": 1, "hits": 0}]},
+            {"filename": "vendor/lib.py", "lines": [{"number": 1, "hits": 0}]},
+        ],
+    )
+    monkeypatch.chdir(root)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["report", str(cov), "--lines", "--no-summary", "--exclude-dir", "vendor"])
+    assert result.exit_code == 0, result.output
+    assert "mod.py" in result.output
+    assert "lib.py" not in result.output
+
+
+def test_cli_report_exclude_dir_spellings(project, monkeypatch, tmp_path_factory) -> None:
+    from tests.conftest import write_cobertura_xml
+
+    root = project["root"]
+    cov = write_cobertura_xml(
+        root,
+        "coverage.xml",
+        classes=[
+            {"filename": "pkg/mod.py", "lines": [{"number": 1, "hits": 0}]},
+            {"filename": "vendor/lib.py", "lines": [{"number": 1, "hits": 0}]},
+        ],
+    )
+    monkeypatch.chdir(root)
+
+    runner = CliRunner()
+    spellings = [str(root / "vendor"), f"../{root.name}/vendor", "./vendor/"]
+    args = ["report", str(cov), "--lines", "--no-summary", "--exclude-dir"]
+    for spelling in spellings:
+        result = runner.invoke(cli, [*args, spelling])
+        assert result.exit_code == 0, result.output
+        assert "mod.py" in result.output, spelling
+        assert "lib.py" not in result.output, spelling
+
+    # A directory outside the base cannot match relative labels; say so instead of ignoring it.
+    elsewhere = tmp_path_factory.mktemp("elsewhere")
+    result = runner.invoke(cli, [*args, str(elsewhere)])
+    assert result.exit_code == 0, result.output
+    assert f"--exclude-dir {elsewhere} is outside" in result.output
+    assert "lib.py" in result.output
@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from showcov.adapters.coverage.cobertura import read_root
+from showcov.adapters.coverage.cobertura import iter_path_line_records, read_root
 from showcov.adapters.coverage.discover import resolve_coverage_paths
 from showcov.errors import CoverageXMLNotFoundError, InvalidCoverageXMLError
 
@@ -37,3 +37,41 @@ def test_read_root_rejects_non_coverage_root(tmp_path: Path) -> None:
     p.write_text("<notcoverage />\n", encoding="utf-8")
     with pytest.raises(InvalidCoverageXMLError):
         read_root(p)
+
+
+def test_iter_path_line_records_rejects_non_coverage_root(tmp_path: Path) -> None:
+    p = tmp_path / "coverage.xml"
+    p.write_text("<notcoverage />\n", encoding="utf-8")
+    with pytest.raises(InvalidCoverageXMLError):
+        list(iter_path_line_records(p))
+
+
+def test_resolve_coverage_paths_deduplicates_same_file(tmp_path: Path) -> None:
+    p = tmp_path / "coverage.xml"
+    p.write_text("<coverage></coverage>\n", encoding="utf-8")
+    (tmp_path / "sub").mkdir()
+
+    got = resolve_coverage_paths([p, tmp_path / "sub" / ".." / "coverage.xml", p], cwd=tmp_path)
+    assert got == (p.resolve(),)
+
+
+def test_discover_prefers_cwd_then_project_root(tmp_path: Path) -> None:
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'x'\n", encoding="utf-8")
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    root_xml = tmp_path / "coverage.xml"
+    root_xml.write_text("<coverage/>\n", encoding="utf-8")
+
+    assert resolve_coverage_paths(None, cwd=sub) == (root_xml.resolve(),)
+
+    dot_xml = sub / ".coverage.xml"
+    dot_xml.write_text("<coverage/>\n", encoding="utf-8")
+    assert resolve_coverage_paths(None, cwd=sub) == (dot_xml.resolve(),)
+
+
+def test_resolve_coverage_paths_reports_every_missing_file(tmp_path: Path) -> None:
+    ok = tmp_path / "ok.xml"
+    ok.write_text("<coverage/>\n", encoding="utf-8")
+
+    with pytest.raises(CoverageXMLNotFoundError, match=r"a\.xml.*b\.xml"):
+        resolve_coverage_paths([tmp_path / "a.xml", ok, tmp_path / "b.xml"], cwd=tmp_path)
@@ -3,6 +3,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import pytest
+
 from showcov.adapters.coverage.records import collect_cobertura_records
 from showcov.engine.build import BuildOptions, build_report
 from showcov.engine.enrich import enrich_report
@@ -68,6 +70,42 @@ def test_enrich_attaches_snippets_and_file_counts(project: dict[str, Path]) -> N
     assert any("def f" in sl.code for sl in r.source)
 
 
+def test_enrich_keeps_file_order_across_many_files(tmp_path: Path) -> None:
+    from tests.conftest import write_cobertura_xml
+
+    names = [f"m{i:02d}.py" for i in range(12)]
+    for i, name in enumerate(names):
+        (tmp_path / name).write_text(f"x = {i}\n", encoding="utf-8")
+    cov = write_cobertura_xml(
+        tmp_path,
+        "coverage.xml",
+        classes=[{"filename": name, "lines": [{"number": 1, "hits": 0}]} for name in names],
+    )
+
+    records = collect_cobertura_records((cov,))
+    opts = BuildOptions(
+        coverage_paths=(cov,),
+        base_path=tmp_path,
+        filters=None,
+        sections={"lines"},
+        branches_mode=BranchMode.PARTIAL,
+        summary_sort=SummarySort.FILE,
+        want_aggregate_stats=False,
+        want_file_stats=False,
+        want_snippets=True,
+        context_before=0,
+        context_after=0,
+        records=records,
+        meta_show_paths=True,
+        meta_show_line_numbers=True,
+    )
+
+    sec = enrich_report(build_report(opts), opts).sections.lines
+    assert sec is not None
+    assert [f.file for f in sec.files] == names
+    assert [f.uncovered[0].source[0].code for f in sec.files] == [f"x = {i}" for i in range(12)]
+
+
 def test_enrich_does_not_crash_when_source_file_missing(tmp_path: Path) -> None:
     from tests.conftest import write_cobertura_xml
 
@@ -105,3 +143,35 @@ def test_enrich_does_not_crash_when_source_file_missing(tmp_path: Path) -> None:
     # Must not crash; snippets may be absent due to missing file.
     f = sec.files[0]
     assert f.uncovered
+
+
+@pytest.mark.parametrize("text", ["", "a", "a\n", "a\nb", "a\n\nb\n", "a\r\nb\r\n", "a\rb", "a\u2028b\n"])
+def test_count_file_lines_matches_splitlines(tmp_path: Path, text: str) -> None:
+    from showcov.engine.enrich import count_file_lines, read_file_lines_uncached
+
+    p = tmp_path / "src.py"
+    p.write_bytes(text.encode("utf-8"))
+    assert count_file_lines(p) == len(read_file_lines_uncached(p))
+    assert count_file_lines(tmp_path / "missing.py") == 0
+
+
+@pytest.mark.parametrize(
+    "text", ["", "a", "a\n", "a\nb", "a\n\nb\n", "a\r\nb\r\n", "a\rb", "a\u2028b\n", "x\r\r\ny\n"]
+)
+@pytest.mark.parametrize("last", [0, 1, 2, 5])
+def test_read_file_lines_through_matches_splitlines_prefix(tmp_path: Path, text: str, last: int) -> None:
+    from showcov.engine import enrich
+
+    p = tmp_path / "src.py"
+    p.write_bytes(text.encode("utf-8"))
+    assert enrich._read_file_lines_through(p, last) == enrich.read_file_lines_uncached(p)[:last]
+    assert enrich._read_file_lines_through(tmp_path / "missing.py", last) == []
+
+
+@pytest.mark.parametrize("last", [1, 2, 3])
+def test_read_file_lines_through_handles_invalid_utf8(tmp_path: Path, last: int) -> None:
+    from showcov.engine import enrich
+
+    p = tmp_path / "src.py"
+    p.write_bytes(b"ok\n\xe2\x82\n\xff tail\n")
+    assert enrich._read_file_lines_through(p, last) == enrich.read_file_lines_uncached(p)[:last]
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import pytest
+
 from showcov.adapters.coverage.cobertura import (
     iter_line_records,
+    iter_path_line_records,
     parse_condition_coverage,
     parse_conditions,
     read_root,
@@ -71,3 +74,254 @@ def test_iter_line_records_and_conditions(project: dict[str, Path]) -> None:
     line_elem = cls.findall("./lines/line")[1]
     conds2 = parse_conditions(line_elem)
     assert conds2
+
+
+def test_iter_path_line_records_matches_tree_walk(project: dict[str, Path]) -> None:
+    from tests.conftest import write_cobertura_xml
+
+    xml = write_cobertura_xml(
+        project["root"],
+        "coverage.xml",
+        classes=[
+            {"filename": "pkg/mod.py", "lines": [{"number": 1, "hits": 1}, {"number": 2, "hits": 0}]},
+            {
+                "filename": "pkg/other.py",
+                "lines": [
+                    {
+                        "number": 1,
+                        "hits": 1,
+                        "branch": True,
+                        "condition_coverage": "50% (1/2)",
+                        "missing_branches": "2",
+                        "conditions": [{"number": 0, "type": "jump", "coverage": "50%"}],
+                    }
+                ],
+            },
+        ],
+    )
+
+    assert list(iter_path_line_records(xml)) == list(iter_line_records(read_root(xml)))
+
+
+def test_cobertura_target_matches_tree_walk(project: dict[str, Path]) -> None:
+    from defusedxml.ElementTree import XMLParser
+
+    from showcov.adapters.coverage import cobertura
+    from tests.conftest import write_cobertura_xml
+
+    xml = write_cobertura_xml(
+        project["root"],
+        "coverage.xml",
+        with_namespace=True,
+        classes=[
+            {
+                "filename": "pkg/mod.py",
+                "lines": [
+                    {"number": 1, "hits": 0},
+                    {
+                        "number": 3,
+                        "hits": 1,
+                        "branch": True,
+                        "condition_coverage": "50% (1/2)",
+                        "missing_branches": "1",
+                        "conditions": [{"number": 1, "type": "jump", "coverage": "0%"}],
+                    },
+                ],
+            }
+        ],
+    )
+
+    parser = XMLParser(target=cobertura._CoberturaTarget(xml))
+    parser.feed(xml.read_bytes())
+    assert parser.close() == list(iter_line_records(read_root(xml)))
+
+
+def test_collect_cobertura_records_keeps_input_order_across_files(project: dict[str, Path]) -> None:
+    from showcov.adapters.coverage.records import collect_cobertura_records
+    from tests.conftest import write_cobertura_xml
+
+    root = project["root"]
+    paths = tuple(
+        write_cobertura_xml(
+            root,
+            f"c{i}.xml",
+            classes=[{"filename": "pkg/mod.py", "lines": [{"number": i + 1, "hits": i}]}],
+        )
+        for i in range(4)
+    )
+
+    merged = collect_cobertura_records(paths)
+    assert merged == [rec for p in paths for rec in collect_cobertura_records((p,))]
+    assert [rec[1] for rec in merged] == [1, 2, 3, 4]
+
+
+def test_trusted_parse_matches_tree_walk(project: dict[str, Path]) -> None:
+    from showcov.adapters.coverage import cobertura
+    from showcov.errors import InvalidCoverageXMLError
+    from tests.conftest import write_cobertura_xml
+
+    root = project["root"]
+    xml = write_cobertura_xml(
+        root,
+        "coverage.xml",
+        classes=[
+            {
+                "filename": "pkg/mod.py",
+                "lines": [
+                    {"number": 1, "hits": 0},
+                    {
+                        "number": 2,
+                        "hits": 1,
+                        "branch": True,
+                        "condition_coverage": "50% (1/2)",
+                        "missing_branches": "3",
+                    },
+                ],
+            }
+        ],
+    )
+
+    assert cobertura._trusted_line_records(xml) == list(iter_line_records(read_root(xml)))
+    assert list(iter_path_line_records(xml, trusted=True)) == list(iter_path_line_records(xml))
+
+    bogus = root / "bogus.xml"
+    bogus.write_text("<report><class filename='x.py'/></report>", encoding="utf-8")
+    with pytest.raises(InvalidCoverageXMLError, match="unexpected root tag"):
+        cobertura._trusted_line_records(bogus)
+
+
+def test_collect_cobertura_records_single_core_skips_pool(project: dict[str, Path], monkeypatch) -> None:
+    from showcov.adapters.coverage import records as records_mod
+    from tests.conftest import write_cobertura_xml
+
+    root = project["root"]
+    paths = tuple(
+        write_cobertura_xml(
+            root,
+            f"c{i}.xml",
+            classes=[{"filename": "pkg/mod.py", "lines": [{"number": i + 1, "hits": 0}]}],
+        )
+        for i in range(2)
+    )
+
+    def no_pool(*_args, **_kwargs):
+        msg = "thread pool should not be used on a single core"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(records_mod.os, "cpu_count", lambda: 1)
+    monkeypatch.setattr(records_mod, "ThreadPoolExecutor", no_pool)
+    assert [rec[1] for rec in records_mod.collect_cobertura_records(paths)] == [1, 2]
+
+
+_LXML_CLASSES = [
+    {"filename": "pkg/mod.py", "lines": [{"number": 1, "hits": 1}, {"number": 2, "hits": 0}]},
+    {
+        "filename": "pkg/other.py",
+        "lines": [
+            {
+                "number": 4,
+                "hits": 1,
+                "branch": True,
+                "condition_coverage": "50% (1/2)",
+                "missing_branches": "7",
+                "conditions": [{"number": 0, "type": "jump", "coverage": "50%"}],
+            }
+        ],
+    },
+]
+
+
+@pytest.mark.parametrize("with_namespace", [False, True], ids=["plain", "namespaced"])
+def test_lxml_backend_matches_tree_walk(project: dict[str, Path], *, with_namespace: bool) -> None:
+    pytest.importorskip("lxml")
+    from showcov.adapters.coverage import cobertura
+    from tests.conftest import write_cobertura_xml
+
+    xml = write_cobertura_xml(
+        project["root"], "coverage.xml", with_namespace=with_namespace, classes=_LXML_CLASSES
+    )
+
+    expected = list(iter_line_records(read_root(xml)))
+    assert expected
+    assert cobertura._lxml_line_records(xml) == expected
+    # With lxml installed this is the only way the defusedxml stream is exercised.
+    assert list(cobertura._iterparse_line_records(xml)) == expected
+
+
+def test_lxml_backend_rejects_bad_root_and_malformed_xml(project: dict[str, Path]) -> None:
+    pytest.importorskip("lxml")
+    from defusedxml.ElementTree import ParseError
+
+    from showcov.adapters.coverage import cobertura
+    from showcov.errors import InvalidCoverageXMLError
+
+    root = project["root"]
+    bogus = root / "bogus.xml"
+    bogus.write_text("<report><class filename='x.py'/></report>", encoding="utf-8")
+    with pytest.raises(InvalidCoverageXMLError, match="unexpected root tag"):
+        read_root(bogus)
+    with pytest.raises(InvalidCoverageXMLError, match="unexpected root tag"):
+        cobertura._lxml_line_records(bogus)
+
+    # Both errors map to the same DataError in the pipeline.
+    broken = root / "broken.xml"
+    broken.write_text("<coverage><packages></coverage>", encoding="utf-8")
+    with pytest.raises(ParseError):
+        read_root(broken)
+    with pytest.raises(InvalidCoverageXMLError, match=r"broken\.xml"):
+        cobertura._lxml_line_records(broken)
+
+
+def test_lxml_backend_defers_dtds_to_defusedxml(project: dict[str, Path]) -> None:
+    pytest.importorskip("lxml")
+    from defusedxml import EntitiesForbidden
+
+    from showcov.adapters.coverage import cobertura
+
+    root = project["root"]
+    entities = root / "entities.xml"
+    entities.write_text(
+        '<?xml version="1.0"?>'
+        '<!DOCTYPE coverage [<!ENTITY x "pkg/mod.py">]>'
+        '<coverage><packages><package><classes><class filename="&x;">'
+        '<lines><line number="1" hits="0"/></lines>'
+        "</class></classes></package></packages></coverage>",
+        encoding="utf-8",
+    )
+    with pytest.raises(EntitiesForbidden):
+        read_root(entities)
+    with pytest.raises(EntitiesForbidden):
+        cobertura._lxml_line_records(entities)
+
+    # A bare external DTD reference (as emitted by Cobertura itself) is still accepted.
+    system = root / "system.xml"
+    system.write_text(
+        '<?xml version="1.0"?>'
+        '<!DOCTYPE coverage SYSTEM "http://cobertura.sourceforge.net/xml/coverage-04.dtd">'
+        '<coverage><packages><package><classes><class filename="pkg/mod.py">'
+        '<lines><line number="1" hits="0"/></lines>'
+        "</class></classes></package></packages></coverage>",
+        encoding="utf-8",
+    )
+    expected = list(iter_line_records(read_root(system)))
+    assert expected
+    assert cobertura._lxml_line_records(system) == expected
+
+
+def test_trusted_parse_uses_expat_even_with_lxml(project: dict[str, Path], monkeypatch) -> None:
+    pytest.importorskip("lxml")
+    from showcov.adapters.coverage import cobertura
+    from tests.conftest import write_cobertura_xml
+
+    xml = write_cobertura_xml(
+        project["root"],
+        "coverage.xml",
+        classes=[{"filename": "pkg/mod.py", "lines": [{"number": 1, "hits": 0}]}],
+    )
+
+    def no_lxml(_path):
+        msg = "--trusted-xml should not parse through lxml"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(cobertura, "_lxml_line_records", no_lxml)
+    assert list(iter_path_line_records(xml, trusted=True)) == list(iter_line_records(read_root(xml)))
@@ -35,3 +35,58 @@ def test_path_filter_filter_files_keeps_payloads(tmp_path: Path) -> None:
     items = [("abc.py", 1), ("zzz.py", 2)]
     kept = pf.filter_files(items)
     assert kept == [("abc.py", 1)]
+
+
+def test_path_filter_matches_fnmatch_semantics(tmp_path: Path) -> None:
+    from fnmatch import fnmatch
+
+    include = ("pkg/*.py", "src/[ab]?.py", "*/tests/*")
+    exclude = ("*_gen.py",)
+    pf = PathFilter(include=include, exclude=exclude, base=tmp_path)
+
+    paths = ["pkg/mod.py", "pkg/sub/deep.py", "src/a1.py", "src/c1.py", "x/tests/t.py", "pkg/api_gen.py"]
+    for p in paths:
+        expected = any(fnmatch(p, pat) for pat in include) and not any(fnmatch(p, pat) for pat in exclude)
+        assert pf.allow(p) is expected, p
+
+
+def test_path_filter_relative_labels_through_symlinked_base(tmp_path: Path) -> None:
+    real = tmp_path / "real"
+    (real / "pkg").mkdir(parents=True)
+    link = tmp_path / "link"
+    link.symlink_to(real, target_is_directory=True)
+
+    pf = PathFilter(include=["pkg/*.py"], base=link)
+    assert pf.allow("pkg/mod.py") is True
+    assert pf.allow(real / "pkg" / "mod.py") is True
+    assert pf.allow(tmp_path / "elsewhere" / "mod.py") is False
+
+
+def test_path_filter_follows_base_symlink_changes(tmp_path: Path) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(first, target_is_directory=True)
+
+    pf = PathFilter(include=["pkg/*.py"], base=link)
+    assert pf.allow(first / "pkg" / "mod.py") is True
+
+    # The filter keeps no resolved base, so a repointed link is seen on the next call.
+    link.unlink()
+    link.symlink_to(second, target_is_directory=True)
+    assert pf.allow(second / "pkg" / "mod.py") is True
+    assert pf.allow(first / "pkg" / "mod.py") is False
+    assert pf.allow(first / "pkg" / "mod.py", resolved_base=first) is True
+
+
+def test_path_filter_exclude_dirs_prefix_match(tmp_path: Path) -> None:
+    pf = PathFilter(base=tmp_path, exclude_dirs=["pkg/sub/", "vendor"])
+    assert pf.allow("pkg/sub/mod.py") is False
+    assert pf.allow("pkg/sub/deeper/mod.py") is False
+    assert pf.allow(tmp_path / "vendor" / "lib.py") is False
+    # Prefixes stop at directory boundaries.
+    assert pf.allow("pkg/subpackage/mod.py") is True
+    assert pf.allow("vendored.py") is True
+    assert pf.exclude_dirs == ("pkg/sub/", "vendor/")
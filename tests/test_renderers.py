@@ -117,3 +117,53 @@ def test_render_summary_max_depth_limits_expansion(project: dict[str, Path]) ->
     assert "pkg/" in out_depth_1
     assert "sub/" not in out_depth_1
     assert "a.py" not in out_depth_1
+
+
+def test_render_source_lines_respect_line_number_option() -> None:
+    from showcov.adapters.render import human
+    from showcov.model.report import SourceLine
+
+    numbered = human._source_line_renderer(RenderOptions(show_line_numbers=True))
+    plain = human._source_line_renderer(RenderOptions(show_line_numbers=False))
+
+    sl = SourceLine(code="def f(x):", line=2, tag="def")
+    assert numbered(sl) == "   2: def f(x):  [def]"
+    assert plain(sl) == "def f(x):  [def]"
+    assert numbered(SourceLine(code="x = 1")) == "x = 1"
+
+
+def test_directory_aggregate_sums_descendant_rows() -> None:
+    from showcov.adapters.render import human
+    from showcov.model.report import SummaryCounts, SummaryRow
+
+    def row(name: str, st: tuple[int, int, int], br: tuple[int, int, int], ranges: int) -> SummaryRow:
+        return SummaryRow(
+            file=name,
+            statements=SummaryCounts(*st),
+            branches=SummaryCounts(*br),
+            statement_pct=0.0,
+            branch_pct=None,
+            uncovered_lines=st[2],
+            uncovered_ranges=ranges,
+        )
+
+    root = human._DirNode(name="", path="")
+    human._insert_file(root, row("pkg/a.py", (4, 3, 1), (0, 0, 0), 1))
+    human._insert_file(root, row("pkg/sub/b.py", (6, 2, 4), (4, 1, 3), 2))
+
+    agg = human._aggregate_dir(root.children["pkg"])
+    assert agg.file == "pkg/"
+    assert (agg.statements.total, agg.statements.covered, agg.statements.missed) == (10, 5, 5)
+    assert (agg.branches.total, agg.branches.covered, agg.branches.missed) == (4, 1, 3)
+    assert (agg.uncovered_lines, agg.uncovered_ranges) == (5, 3)
+    assert agg.statement_pct == pytest.approx(50.0)
+    assert agg.branch_pct == pytest.approx(25.0)
+
+
+@pytest.mark.parametrize("label", ["mod.py", "pkg/mod.py", "pkg/sub/a.py", "/abs/pkg/a.py"])
+def test_posix_parts_matches_pure_posix_path(label: str) -> None:
+    from pathlib import PurePosixPath
+
+    from showcov.adapters.render import human
+
+    assert human._posix_parts(label) == list(PurePosixPath(label).parts)
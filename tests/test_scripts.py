@@ -1,3 +1,5 @@
+from click.testing import CliRunner
+
 from showcov.entrypoints.cli import cli
 from showcov.entrypoints.cli.completion import build_completion_script
 from showcov.entrypoints.cli.man import build_man_page
@@ -19,3 +21,18 @@ def test_build_completion_script_includes_report_flags() -> None:
     assert "--context" in script
     assert "--fail-under-stmt" in script
     assert "--max-depth" in script
+
+
+def test_man_command_documents_every_subcommand() -> None:
+    result = CliRunner().invoke(cli, ["man", "--output", "-"])
+    assert result.exit_code == 0, result.output
+    for name in ("report", "completion", "man"):
+        assert f"│ {name}" in result.output
+
+
+def test_version_option_reports_package_version() -> None:
+    import showcov
+
+    result = CliRunner().invoke(cli, ["--version", "man"])
+    assert result.exit_code == 0, result.output
+    assert result.output == f"showcov {showcov.__version__}\n"
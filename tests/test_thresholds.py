@@ -45,6 +45,14 @@ def test_parse_threshold() -> None:
         parse_threshold("")
 
 
+def test_parse_threshold_is_cached_and_still_rejects_bad_input() -> None:
+    assert parse_threshold("stmt=75 misses=3") is parse_threshold("stmt=75 misses=3")
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match=r"unknown threshold metric"):
+            parse_threshold("lines=90")
+
+
 def test_thresholds_pass_and_fail(project: dict[str, Path]) -> None:
     from tests.conftest import write_cobertura_xml
 
@@ -68,3 +76,53 @@ def test_thresholds_pass_and_fail(project: dict[str, Path]) -> None:
     assert bad.passed is False
     assert bad.failures
     assert bad.failures[0].metric == "statement"
+
+
+def test_threshold_failures_are_reported_per_metric_in_order(project: dict[str, Path]) -> None:
+    from tests.conftest import write_cobertura_xml
+
+    root = project["root"]
+    cov = write_cobertura_xml(
+        root,
+        "coverage.xml",
+        classes=[
+            {"filename": "pkg/mod.py", "lines": [{"number": 1, "hits": 1}, {"number": 2, "hits": 0}]},
+        ],
+    )
+    report = _build_report_for_thresholds(root, cov)
+
+    result = evaluate(report, [Threshold(misses=0), Threshold(statement=60, misses=1)])
+    assert [(f.metric, f.comparison, f.actual) for f in result.failures] == [
+        ("statement", ">=", 50.0),
+        ("misses", "<=", 1),
+    ]
+
+
+def test_misses_threshold_uses_lines_summary_total(project: dict[str, Path]) -> None:
+    from dataclasses import replace
+
+    from showcov.model.report import LineSummary
+    from tests.conftest import write_cobertura_xml
+
+    root = project["root"]
+    cov = write_cobertura_xml(
+        root,
+        "coverage.xml",
+        classes=[
+            {"filename": "pkg/mod.py", "lines": [{"number": n, "hits": 0} for n in (1, 2, 3, 5)]},
+        ],
+    )
+    report = _build_report_for_thresholds(root, cov)
+    lines = report.sections.lines
+    assert lines is not None
+    assert lines.summary is None
+
+    walked = evaluate(report, [Threshold(misses=2)])
+    assert [f.actual for f in walked.failures] == [4]
+
+    # A summary total that differs from the walked count shows which one is used.
+    with_summary = replace(
+        report, sections=replace(report.sections, lines=replace(lines, summary=LineSummary(uncovered=99)))
+    )
+    result = evaluate(with_summary, [Threshold(misses=2)])
+    assert [f.actual for f in result.failures] == [99]